@@ -1,30 +1,378 @@
-from flask import Flask, render_template_string, request, redirect, url_for, session, jsonify
+from flask import Flask, Request, render_template, request, redirect, url_for, session, jsonify, g, abort
+from flask import before_render_template, template_rendered
+from flask.json.provider import DefaultJSONProvider
 import sqlite3
-from werkzeug.utils import secure_filename
+import click
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
 import os
+import io
+import tempfile
+import zipfile
+from xml.etree import ElementTree
 import PyPDF2
 import re
+from collections import OrderedDict, deque
+import numpy as np
 import secrets
+import hashlib
+import gzip
+import zlib
+import mimetypes
+import brotli
+import threading
+import functools
+import json
+import time
+import uuid
+import itertools
+import contextlib
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 app = Flask(__name__)
+# Templates are compiled once per process and their bytecode is cached on disk,
+# so new workers load them without parsing the sources again
+app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache()}
 # Use environment variable for secret key, or generate one if not set
 app.secret_key = os.environ.get('SECRET_KEY', secrets.token_hex(32))
 
+DATABASE = os.environ.get('DATABASE', 'database.db')
+# Bytes of the database file each connection memory-maps
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Per-stage timings (db, render, parse, match), reported in a Server-Timing
+# header and a JSON log line per request when SERVER_TIMING=1. When it is off
+# timed() hands back a shared no-op context, no hooks are installed and the
+# db stage is never recorded.
+SERVER_TIMING = os.environ.get('SERVER_TIMING') == '1'
+
+# Stage -> (seconds, calls) for the request or resume task this thread is running
+timing_local = threading.local()
+no_timing = contextlib.nullcontext()
+
+def record_timing(stage, seconds):
+    stages = getattr(timing_local, 'stages', None)
+    if stages is not None:
+        total, calls = stages.get(stage, (0.0, 0))
+        stages[stage] = (total + seconds, calls + 1)
+
+class StageTimer:
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        record_timing(self.stage, time.perf_counter() - self.start)
+
+def timed(stage):
+    return StageTimer(stage) if SERVER_TIMING else no_timing
+
+def timing_summary(stages):
+    return {stage: {'ms': round(seconds * 1000, 3), 'calls': calls}
+            for stage, (seconds, calls) in stages.items()}
+
+# Prometheus metrics. Every process (web worker or resume pool process) keeps
+# its counters and histograms in memory and writes them to its own JSON file
+# in METRICS_DIR. A background thread rewrites the file every
+# METRICS_FLUSH_INTERVAL while there are new values, so an idle process still
+# publishes its last updates; /metrics sums all the files, so the totals cover
+# every gunicorn worker and its pool.
+METRICS_DIR = os.environ.get('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'careersync-metrics'))
+METRICS_FLUSH_INTERVAL = 1.0
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQLITE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# name -> (type, help, histogram buckets)
+METRICS = {
+    'careersync_http_requests_total':
+        ('counter', 'HTTP requests by endpoint, method and status.', None),
+    'careersync_http_request_duration_seconds':
+        ('histogram', 'HTTP request latency by endpoint.', LATENCY_BUCKETS),
+    'careersync_sqlite_call_duration_seconds':
+        ('histogram', 'SQLite execute, fetch and commit calls by operation.', SQLITE_BUCKETS),
+    'careersync_pdf_pages_parsed_total':
+        ('counter', 'PDF pages read from uploaded resumes.', None),
+    'careersync_upload_bytes_total':
+        ('counter', 'Bytes of uploaded files received.', None),
+    'careersync_skills_matched_total':
+        ('counter', 'Skills found by the matcher, by source (resume or job).', None),
+    'careersync_cache_requests_total':
+        ('counter', 'Cache lookups by cache and result (hit or miss).', None),
+}
+
+class MetricsRegistry:
+    def __init__(self):
+        self.reset()
+
+    # Runs again in every forked child, so each process starts from zero with
+    # its own file and never re-reports its parent's counts
+    def reset(self):
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.values = {}
+        self.path = os.path.join(METRICS_DIR, f'{os.getpid()}-{uuid.uuid4().hex[:8]}.json')
+        self.dirty = False
+        self.flusher = None
+
+    # Called with the lock held after every update. The flusher thread is
+    # started on first use, since threads do not survive a fork.
+    def changed(self):
+        self.dirty = True
+        if self.flusher is None:
+            self.flusher = threading.Thread(target=self.flush_loop, daemon=True)
+            self.flusher.start()
+
+    def flush_loop(self):
+        while True:
+            time.sleep(METRICS_FLUSH_INTERVAL)
+            if self.dirty:
+                self.flush()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+            self.changed()
+
+    # Histogram series are per-bucket counts (the last bucket is +Inf) followed by the sum
+    def observe(self, name, value, **labels):
+        buckets = METRICS[name][2]
+        key = (name, tuple(labels.items()))
+        with self.lock:
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = [0] * (len(buckets) + 1) + [0.0]
+            series[bisect.bisect_left(buckets, value)] += 1
+            series[-1] += value
+            self.changed()
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                self.dirty = False
+                data = json.dumps([[name, labels, value] for (name, labels), value in self.values.items()])
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            with open(self.path + '.tmp', 'w') as f:
+                f.write(data)
+            os.replace(self.path + '.tmp', self.path)
+
+    def cache_lookup(self, cache, hit):
+        self.inc('careersync_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+
+metrics = MetricsRegistry()
+os.register_at_fork(after_in_child=metrics.reset)
+
+# Sum the files written by every process, merging series with the same labels
+def collect_metrics():
+    totals = {}
+    try:
+        names = os.listdir(METRICS_DIR)
+    except FileNotFoundError:
+        names = []
+    for filename in names:
+        if not filename.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(METRICS_DIR, filename)) as f:
+                series = json.load(f)
+        except (FileNotFoundError, ValueError):
+            continue
+        for name, labels, value in series:
+            key = (name, tuple(sorted((label, str(v)) for label, v in labels)))
+            if isinstance(value, list):
+                current = totals.get(key)
+                totals[key] = value if current is None else [a + b for a, b in zip(current, value)]
+            else:
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+def escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{label}="{escape_label(value)}"' for label, value in labels) + '}'
+
+# Prometheus text exposition format
+def render_metrics(totals):
+    by_name = {}
+    for (name, labels), value in sorted(totals.items()):
+        by_name.setdefault(name, []).append((labels, value))
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in by_name.get(name, []):
+            if kind != 'histogram':
+                lines.append(f'{name}{format_labels(labels)} {value}')
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets + ('+Inf',), value[:-1]):
+                cumulative += count
+                lines.append(f'{name}_bucket{format_labels(labels + (("le", str(bound)),))} {cumulative}')
+            lines.append(f'{name}_sum{format_labels(labels)} {value[-1]}')
+            lines.append(f'{name}_count{format_labels(labels)} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+# Remove the files of earlier runs; gunicorn.conf.py calls this before forking
+def clear_metrics():
+    if os.path.isdir(METRICS_DIR):
+        for filename in os.listdir(METRICS_DIR):
+            os.remove(os.path.join(METRICS_DIR, filename))
+
+@app.before_request
+def start_request_metrics():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    endpoint = request.endpoint or 'none'
+    metrics.inc('careersync_http_requests_total', endpoint=endpoint, method=request.method,
+                status=str(response.status_code))
+    if 'request_start' in g:
+        metrics.observe('careersync_http_request_duration_seconds', time.perf_counter() - g.request_start,
+                        endpoint=endpoint)
+    return response
+
+# Times one SQLite call for the metrics histogram and, when enabled, the db stage
+class SQLiteTimer:
+    __slots__ = ('operation', 'start')
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        metrics.observe('careersync_sqlite_call_duration_seconds', elapsed, operation=self.operation)
+        record_timing('db', elapsed)
+
+# Every query, fetch and commit is timed
+class TimedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        with SQLiteTimer('execute'):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        with SQLiteTimer('execute'):
+            return super().executemany(sql, seq_of_parameters)
+
+    def fetchone(self):
+        with SQLiteTimer('fetch'):
+            return super().fetchone()
+
+    def fetchall(self):
+        with SQLiteTimer('fetch'):
+            return super().fetchall()
+
+class TimedConnection(sqlite3.Connection):
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        with SQLiteTimer('commit'):
+            super().commit()
+
+# Templates and JSON bodies both count as render
+class TimedJSONProvider(DefaultJSONProvider):
+    def response(self, *args, **kwargs):
+        with timed('render'):
+            return super().response(*args, **kwargs)
+
+def start_render_timing(sender, **extra):
+    timing_local.render_start = time.perf_counter()
+
+def stop_render_timing(sender, **extra):
+    record_timing('render', time.perf_counter() - timing_local.render_start)
+
+if SERVER_TIMING:
+    app.json = TimedJSONProvider(app)
+    before_render_template.connect(start_render_timing, app)
+    template_rendered.connect(stop_render_timing, app)
+
+    @app.before_request
+    def start_request_timing():
+        timing_local.stages = {}
+        timing_local.request_start = time.perf_counter()
+
+    @app.after_request
+    def report_request_timing(response):
+        stages = timing_local.stages
+        timing_local.stages = None
+        total = time.perf_counter() - timing_local.request_start
+        response.headers['Server-Timing'] = ', '.join(
+            [f'{stage};dur={seconds * 1000:.3f}' for stage, (seconds, calls) in stages.items()]
+            + [f'total;dur={total * 1000:.3f}'])
+        print(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 3),
+            'stages': timing_summary(stages),
+        }), flush=True)
+        return response
+
 # Database setup
-def init_db():
-    conn = sqlite3.connect('database.db')
-    cursor = conn.cursor()
-    
-    # Create tables only if they don't exist (remove the DROP TABLE statements)
-    cursor.execute('''
+def connect_db():
+    conn = sqlite3.connect(DATABASE, factory=TimedConnection)
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA cache_size = -16000')
+    conn.execute(f'PRAGMA mmap_size = {MMAP_SIZE}')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    return conn
+
+# One connection per worker thread, reused across requests so each request
+# skips the file open and starts with a warm page cache. The pid check keeps
+# a forked worker from reusing a connection inherited from its parent.
+db_local = threading.local()
+
+def get_db():
+    if 'db' not in g:
+        if getattr(db_local, 'pid', None) != os.getpid():
+            db_local.conn = connect_db()
+            db_local.pid = os.getpid()
+        g.db = db_local.conn
+    return g.db
+
+@app.teardown_appcontext
+def release_db(exception):
+    conn = g.pop('db', None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
+# Schema migrations, applied in order. PRAGMA user_version records how many
+# have run against the database file, so each step executes exactly once.
+# Statements use IF NOT EXISTS so databases created before versioning upgrade
+# cleanly.
+MIGRATIONS = [
+    # 1: base schema
+    [
+        '''
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
             password TEXT NOT NULL,
             role TEXT NOT NULL
         )
-    ''')
-    cursor.execute('''
+        ''',
+        '''
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             company_name TEXT NOT NULL,
@@ -35,16 +383,226 @@ def init_db():
             location TEXT NOT NULL,
             job_type TEXT NOT NULL
         )
-    ''')
-    conn.commit()
+        ''',
+        # Skills found in each posting, extracted once when the job is saved
+        '''
+        CREATE TABLE IF NOT EXISTS job_skills (
+            job_id INTEGER NOT NULL REFERENCES jobs(id),
+            skill TEXT NOT NULL,
+            PRIMARY KEY (job_id, skill)
+        ) WITHOUT ROWID
+        ''',
+        # Inverted index from each skill to the jobs that require it
+        'CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills (skill, job_id)',
+    ],
+    # 2: filter_jobs indexes. Between them their prefixes cover every
+    # combination of location, job_type and experience.
+    [
+        'CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location, job_type, experience)',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_job_type ON jobs (job_type, experience)',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_experience ON jobs (experience, location)',
+    ],
+    # 3: keyset pagination orders by id, which only comes for free when the
+    # filtered columns are the whole index key (rowid is its implicit last
+    # column). Add the remaining combinations so no page needs a sort.
+    [
+        'CREATE INDEX IF NOT EXISTS idx_jobs_location_only ON jobs (location)',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_job_type_only ON jobs (job_type)',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_experience_only ON jobs (experience)',
+        'CREATE INDEX IF NOT EXISTS idx_jobs_location_job_type ON jobs (location, job_type)',
+    ],
+    # 4: full-text index over the job text, kept in sync with jobs by triggers
+    [
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            role_name, company_name, description, qualifications,
+            content='jobs', content_rowid='id', tokenize='porter unicode61'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, role_name, company_name, description, qualifications)
+            VALUES (new.id, new.role_name, new.company_name, new.description, new.qualifications);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, role_name, company_name, description, qualifications)
+            VALUES ('delete', old.id, old.role_name, old.company_name, old.description, old.qualifications);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, role_name, company_name, description, qualifications)
+            VALUES ('delete', old.id, old.role_name, old.company_name, old.description, old.qualifications);
+            INSERT INTO jobs_fts (rowid, role_name, company_name, description, qualifications)
+            VALUES (new.id, new.role_name, new.company_name, new.description, new.qualifications);
+        END
+        ''',
+        # Index the jobs that were posted before the table existed
+        "INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')",
+    ],
+    # 5: background resume parsing tasks, visible to every worker process
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS resume_tasks (
+            id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            status TEXT NOT NULL,
+            skills TEXT,
+            created_at REAL NOT NULL
+        )
+        ''',
+    ],
+    # 6: skills already extracted from a resume, keyed by the file's SHA-256
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS resume_cache (
+            hash TEXT PRIMARY KEY,
+            version TEXT NOT NULL,
+            skills TEXT NOT NULL,
+            last_used REAL NOT NULL
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_resume_cache_last_used ON resume_cache (last_used)',
+    ],
+    # 7: each job seeker's resume skills, stored server-side as small integer
+    # ids into the skill taxonomy instead of in the session cookie
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS user_skills (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            skill_id INTEGER NOT NULL REFERENCES skills(id),
+            PRIMARY KEY (user_id, skill_id)
+        ) WITHOUT ROWID
+        ''',
+        # Skill -> candidates, for recruiters ranking applicants against a job
+        'CREATE INDEX IF NOT EXISTS idx_user_skills_skill ON user_skills (skill_id, user_id)',
+    ],
+    # 8: version counters for data that workers keep in memory; a writer bumps
+    # one in the same transaction so every process knows to reload
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS cache_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+        ''',
+        "INSERT OR IGNORE INTO cache_versions (name, version) VALUES ('job_skills', 0)",
+    ],
+    # 9: counter for the candidate skill matrix
+    [
+        "INSERT OR IGNORE INTO cache_versions (name, version) VALUES ('user_skills', 0)",
+    ],
+]
+
+def init_db():
+    conn = connect_db()
+    
+    # Write-ahead logging lets readers carry on while post_job writes
+    conn.execute('PRAGMA journal_mode = WAL')
+    
+    # BEGIN IMMEDIATE serialises workers that start at the same time; each
+    # re-reads the version inside its transaction before migrating
+    while True:
+        conn.execute('BEGIN IMMEDIATE')
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= len(MIGRATIONS):
+            conn.rollback()
+            break
+        try:
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute(f'PRAGMA user_version = {version + 1}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    check_filter_query_plans(conn)
     conn.close()
 
+# Columns filter_jobs can filter on
+JOB_FILTERS = ('location', 'job_type', 'experience')
+
+def job_filter_conditions(filters):
+    conditions = ''
+    params = []
+    for column in JOB_FILTERS:
+        if filters.get(column):
+            conditions += f' AND {column} = ?'
+            params.append(filters[column])
+    return conditions, params
+
+# One page of jobs after the given id (keyset pagination), so every page
+# costs the same no matter how deep the user has scrolled
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Read 'after' and 'limit' from query args or a JSON body
+def page_params(source):
+    try:
+        after = max(int(source.get('after') or 0), 0)
+    except (TypeError, ValueError):
+        after = 0
+    try:
+        limit = min(max(int(source.get('limit') or DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+    except (TypeError, ValueError):
+        limit = DEFAULT_PAGE_SIZE
+    return after, limit
+
+# Listings only need the fields shown on a job card; the full description and
+# qualifications are served by /job_details
+JOB_CARD_FIELDS = ('id', 'company_name', 'role_name', 'experience', 'location', 'job_type')
+SNIPPET_LENGTH = 160
+
+def job_card_columns(snippet=False):
+    columns = ', '.join(JOB_CARD_FIELDS)
+    if snippet:
+        columns += f', substr(description, 1, {SNIPPET_LENGTH}) AS snippet'
+    return columns
+
+def job_card(row):
+    card = dict(zip(JOB_CARD_FIELDS, row))
+    if len(row) > len(JOB_CARD_FIELDS):
+        card['snippet'] = row[len(JOB_CARD_FIELDS)]
+    return card
+
+def job_page_query(filters, after, limit, snippet=False):
+    conditions, params = job_filter_conditions(filters)
+    # One extra row tells us whether there is a next page
+    return (f'SELECT {job_card_columns(snippet)} FROM jobs WHERE id > ?' + conditions + ' ORDER BY id LIMIT ?',
+            [after] + params + [limit + 1])
+
+def fetch_job_page(cursor, filters, after, limit, snippet=False):
+    cursor.execute(*job_page_query(filters, after, limit, snippet))
+    jobs = [job_card(row) for row in cursor.fetchall()]
+    next_after = jobs[limit - 1]['id'] if len(jobs) > limit else None
+    return jobs[:limit], next_after
+
+# Fail fast at startup if any filter combination would scan the whole table
+# or sort its matches to find a page
+def check_filter_query_plans(conn):
+    for size in range(1, len(JOB_FILTERS) + 1):
+        for columns in itertools.combinations(JOB_FILTERS, size):
+            query, params = job_page_query({column: 'x' for column in columns}, 0, DEFAULT_PAGE_SIZE)
+            plan = [step[3] for step in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+            if (not any('USING INDEX' in step or 'USING COVERING INDEX' in step for step in plan)
+                    or any('TEMP B-TREE' in step for step in plan)):
+                raise RuntimeError(f"filter_jobs on {', '.join(columns)} does not use an index: {plan}")
+
 # Initialize the database
 init_db()
 
 # Add these configurations after app initialization
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
+ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
 # Create uploads directory if it doesn't exist
@@ -55,1263 +613,54 @@ if not os.path.exists(UPLOAD_FOLDER):
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-# HTML Templates
-home_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CareerSync AI - Winner of Alliance University Code Sangram 2025</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700;800&family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes float {
-            0% { transform: translateY(0px); }
-            50% { transform: translateY(-20px); }
-            100% { transform: translateY(0px); }
-        }
-
-        @keyframes shine {
-            0% { background-position: -200% center; }
-            100% { background-position: 200% center; }
-        }
-
-        @keyframes slideInLeft {
-            from { transform: translateX(-100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes slideInRight {
-            from { transform: translateX(100px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-
-        @keyframes rotateIn {
-            from { transform: rotate(-180deg); opacity: 0; }
-            to { transform: rotate(0); opacity: 1; }
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Poppins', 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            margin: 0;
-            padding: 0;
-            background: #0a0e27;
-            background-image: 
-                radial-gradient(at 0% 0%, rgba(120, 119, 198, 0.3) 0px, transparent 50%),
-                radial-gradient(at 100% 0%, rgba(255, 119, 198, 0.3) 0px, transparent 50%),
-                radial-gradient(at 100% 100%, rgba(120, 219, 255, 0.3) 0px, transparent 50%),
-                radial-gradient(at 0% 100%, rgba(255, 219, 119, 0.3) 0px, transparent 50%);
-            background-size: 400% 400%;
-            animation: gradientShift 20s ease infinite;
-            color: #fff;
-            min-height: 100vh;
-            overflow-x: hidden;
-            position: relative;
-        }
-
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: 
-                linear-gradient(45deg, transparent 30%, rgba(255, 255, 255, 0.05) 50%, transparent 70%),
-                linear-gradient(-45deg, transparent 30%, rgba(255, 255, 255, 0.05) 50%, transparent 70%);
-            background-size: 200% 200%;
-            animation: shineOverlay 8s linear infinite;
-            pointer-events: none;
-            z-index: 1;
-        }
-
-        @keyframes gradientShift {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        @keyframes shineOverlay {
-            0% { background-position: -200% -200%; }
-            100% { background-position: 200% 200%; }
-        }
-
-        nav {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 25px 80px;
-            background: rgba(10, 14, 39, 0.8);
-            backdrop-filter: blur(30px) saturate(180%);
-            position: fixed;
-            width: 100%;
-            top: 0;
-            z-index: 1000;
-            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.3), 0 0 0 1px rgba(255, 255, 255, 0.1);
-            border-bottom: 1px solid rgba(255, 255, 255, 0.15);
-            transition: all 0.3s ease;
-        }
-
-        nav:hover {
-            background: rgba(10, 14, 39, 0.95);
-            box-shadow: 0 15px 50px rgba(0, 0, 0, 0.4);
-        }
-
-        .nav-links {
-            display: flex;
-            gap: 20px;
-        }
-
-        .nav-button {
-            color: #fff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 25px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-            background: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-
-        .nav-button:hover {
-            background: rgba(255, 255, 255, 0.2);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-
-        .nav-button.primary {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            border: none;
-        }
-
-        .nav-button.primary:hover {
-            background: linear-gradient(45deg, #00ff9d, #00d4ff);
-        }
-
-        .award-badge {
-            text-align: center;
-            padding: 140px 20px 60px;
-            animation: fadeIn 1s ease-out;
-            position: relative;
-            z-index: 2;
-        }
-
-        .award-badge .trophy {
-            font-size: 6rem;
-            margin-bottom: 25px;
-            animation: float 3s ease-in-out infinite, rotateGlow 4s ease-in-out infinite;
-            filter: drop-shadow(0 0 30px rgba(255, 215, 0, 0.6));
-            display: inline-block;
-        }
-
-        @keyframes rotateGlow {
-            0%, 100% { filter: drop-shadow(0 0 30px rgba(255, 215, 0, 0.6)) rotate(0deg); }
-            50% { filter: drop-shadow(0 0 50px rgba(255, 215, 0, 0.9)) rotate(5deg); }
-        }
-
-        .award-badge .badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #ffd700 0%, #ffed4e 50%, #ffd700 100%);
-            background-size: 200% 200%;
-            color: #1a1a1a;
-            padding: 20px 50px;
-            border-radius: 50px;
-            font-weight: 800;
-            font-size: 1.3rem;
-            box-shadow: 
-                0 15px 50px rgba(255, 215, 0, 0.5),
-                0 0 0 3px rgba(255, 215, 0, 0.3),
-                inset 0 2px 10px rgba(255, 255, 255, 0.3);
-            animation: pulse 2s infinite, shimmer 3s infinite;
-            margin-bottom: 20px;
-            text-transform: uppercase;
-            letter-spacing: 3px;
-            position: relative;
-            overflow: hidden;
-        }
-
-        @keyframes shimmer {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .award-badge .badge::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(45deg, transparent, rgba(255, 255, 255, 0.4), transparent);
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .award-badge .subtitle {
-            font-size: 1.1rem;
-            opacity: 0.9;
-            margin-top: 15px;
-            font-weight: 500;
-            letter-spacing: 1px;
-        }
-
-        .hero {
-            text-align: center;
-            padding: 60px 20px 120px;
-            animation: fadeIn 1s ease-out;
-            position: relative;
-            z-index: 2;
-        }
-
-        .hero h1 {
-            font-size: 6.5rem;
-            font-weight: 900;
-            margin-bottom: 40px;
-            text-shadow: 
-                0 0 30px rgba(0, 212, 255, 0.5),
-                0 0 60px rgba(0, 255, 157, 0.3),
-                0 10px 40px rgba(0, 0, 0, 0.5);
-            animation: float 6s ease-in-out infinite, textGlow 3s ease-in-out infinite;
-            letter-spacing: -3px;
-            line-height: 1.1;
-        }
-
-        @keyframes textGlow {
-            0%, 100% { 
-                text-shadow: 
-                    0 0 30px rgba(0, 212, 255, 0.5),
-                    0 0 60px rgba(0, 255, 157, 0.3),
-                    0 10px 40px rgba(0, 0, 0, 0.5);
-            }
-            50% { 
-                text-shadow: 
-                    0 0 50px rgba(0, 212, 255, 0.8),
-                    0 0 100px rgba(0, 255, 157, 0.5),
-                    0 15px 60px rgba(0, 0, 0, 0.6);
-            }
-        }
-
-        .hero p {
-            font-size: 1.5rem;
-            margin-bottom: 40px;
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-            animation-delay: 0.5s;
-        }
-
-        .hero .btn {
-            padding: 15px 40px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: #fff;
-            text-decoration: none;
-            border-radius: 30px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            display: inline-block;
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-            animation-delay: 1s;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .hero .btn::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(
-                45deg,
-                transparent,
-                rgba(255, 255, 255, 0.3),
-                transparent
-            );
-            transform: rotate(45deg);
-            animation: shine 3s infinite;
-        }
-
-        .hero .btn:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-        }
-
-        section {
-            padding: 100px 40px;
-            text-align: center;
-            background: rgba(10, 14, 39, 0.6);
-            backdrop-filter: blur(30px) saturate(180%);
-            margin: 40px auto;
-            max-width: 1400px;
-            border-radius: 30px;
-            border: 1px solid rgba(255, 255, 255, 0.15);
-            box-shadow: 
-                0 20px 60px rgba(0, 0, 0, 0.4),
-                inset 0 1px 0 rgba(255, 255, 255, 0.1);
-            opacity: 0;
-            animation: fadeIn 1s ease-out forwards;
-            position: relative;
-            z-index: 2;
-            overflow: hidden;
-        }
-
-        section::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.05), transparent);
-            animation: sectionShine 5s infinite;
-        }
-
-        @keyframes sectionShine {
-            0% { left: -100%; }
-            100% { left: 100%; }
-        }
-
-        section h2 {
-            font-size: 3.5rem;
-            margin-bottom: 50px;
-            background: linear-gradient(135deg, #fff 0%, #00d4ff 50%, #00ff9d 100%);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: 800;
-            text-shadow: 0 0 40px rgba(0, 212, 255, 0.3);
-            letter-spacing: -1px;
-            position: relative;
-        }
-
-        section h2::after {
-            content: '';
-            position: absolute;
-            bottom: -15px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 100px;
-            height: 4px;
-            background: linear-gradient(90deg, #00d4ff, #00ff9d);
-            border-radius: 2px;
-            box-shadow: 0 0 20px rgba(0, 212, 255, 0.5);
-        }
-
-        ul, ol {
-            list-style: none;
-            padding: 0;
-            max-width: 800px;
-            margin: 0 auto;
-        }
-
-        li {
-            margin: 20px 0;
-            padding: 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            transition: transform 0.3s ease;
-            cursor: pointer;
-        }
-
-        li:hover {
-            transform: scale(1.05);
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        .title-highlight {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: bold;
-            display: inline-block;
-        }
-
-        .feature-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }
-
-        .feature-card {
-            background: rgba(255, 255, 255, 0.08);
-            padding: 40px 30px;
-            border-radius: 20px;
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            border: 1px solid rgba(255, 255, 255, 0.15);
-            position: relative;
-            overflow: hidden;
-            backdrop-filter: blur(20px);
-        }
-
-        .feature-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, rgba(0, 212, 255, 0.1), rgba(0, 255, 157, 0.1));
-            opacity: 0;
-            transition: opacity 0.4s ease;
-        }
-
-        .feature-card:hover {
-            transform: translateY(-15px) scale(1.02);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(0, 212, 255, 0.5);
-            box-shadow: 
-                0 20px 60px rgba(0, 212, 255, 0.3),
-                0 0 0 1px rgba(0, 255, 157, 0.3);
-        }
-
-        .feature-card:hover::before {
-            opacity: 1;
-        }
-
-        .feature-card h3 {
-            font-size: 1.8rem;
-            margin-bottom: 15px;
-            background: linear-gradient(135deg, #00d4ff, #00ff9d);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: 700;
-        }
-
-        .feature-card p {
-            font-size: 1.05rem;
-            line-height: 1.7;
-            opacity: 0.9;
-        }
-
-        @media (max-width: 768px) {
-            .hero h1 {
-                font-size: 3rem;
-            }
-            
-            nav {
-                padding: 15px 20px;
-            }
-            
-            .nav-links {
-                gap: 10px;
-            }
-            
-            .nav-button {
-                padding: 8px 15px;
-                font-size: 0.9rem;
-            }
-            
-            section {
-                margin: 10px;
-                padding: 40px 15px;
-            }
-        }
-
-        .cta-buttons {
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            margin-top: 30px;
-        }
-
-        .cta-btn {
-            padding: 20px 50px;
-            background: linear-gradient(135deg, #00d4ff 0%, #00ff9d 50%, #00d4ff 100%);
-            background-size: 200% 200%;
-            color: #fff;
-            text-decoration: none;
-            border-radius: 50px;
-            font-weight: 700;
-            font-size: 1.1rem;
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            animation: pulse 2s infinite, gradientMove 3s ease infinite;
-            box-shadow: 
-                0 10px 30px rgba(0, 212, 255, 0.4),
-                0 0 0 2px rgba(0, 255, 157, 0.3);
-            position: relative;
-            overflow: hidden;
-            letter-spacing: 1px;
-            text-transform: uppercase;
-        }
-
-        @keyframes gradientMove {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        .cta-btn::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.4), transparent);
-            transition: left 0.5s ease;
-        }
-
-        .cta-btn:hover {
-            transform: translateY(-8px) scale(1.05);
-            box-shadow: 
-                0 20px 50px rgba(0, 212, 255, 0.6),
-                0 0 0 3px rgba(0, 255, 157, 0.5);
-            background-position: 100% 50%;
-        }
-
-        .cta-btn:hover::before {
-            left: 100%;
-        }
-
-        .testimonials {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
-
-        .testimonial-card {
-            background: rgba(255, 255, 255, 0.08);
-            padding: 40px 35px;
-            border-radius: 25px;
-            backdrop-filter: blur(30px) saturate(180%);
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            animation: fadeIn 0.5s ease-out forwards;
-            border: 1px solid rgba(255, 255, 255, 0.15);
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-            position: relative;
-            overflow: hidden;
-        }
-
-        .testimonial-card::before {
-            content: '"';
-            position: absolute;
-            top: -20px;
-            left: 20px;
-            font-size: 8rem;
-            color: rgba(0, 212, 255, 0.2);
-            font-family: serif;
-            line-height: 1;
-        }
-
-        .testimonial-card:hover {
-            transform: translateY(-15px) scale(1.02);
-            background: rgba(255, 255, 255, 0.15);
-            border-color: rgba(0, 212, 255, 0.5);
-            box-shadow: 
-                0 25px 60px rgba(0, 212, 255, 0.3),
-                0 0 0 1px rgba(0, 255, 157, 0.3);
-        }
-
-        .why-us-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
-
-        .why-us-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 25px;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-            animation: slideInRight 0.5s ease-out forwards;
-        }
-
-        .why-us-card:hover {
-            transform: translateY(-5px) scale(1.02);
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        .process-steps {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 30px;
-            padding: 20px;
-        }
-
-        .process-step {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-            animation: rotateIn 0.5s ease-out forwards;
-        }
-
-        .process-step:hover {
-            transform: scale(1.05);
-            background: rgba(255, 255, 255, 0.2);
-        }
-
-        .stats-section {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 30px;
-            padding: 60px 20px;
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        .stat-card {
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(30px) saturate(180%);
-            padding: 50px 40px;
-            border-radius: 25px;
-            text-align: center;
-            border: 2px solid rgba(255, 255, 255, 0.2);
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            position: relative;
-            overflow: hidden;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-        }
-
-        .stat-card::after {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(0, 212, 255, 0.2), transparent);
-            opacity: 0;
-            transition: opacity 0.4s ease;
-        }
-
-        .stat-card:hover {
-            transform: translateY(-15px) scale(1.05);
-            background: rgba(255, 255, 255, 0.2);
-            border-color: rgba(0, 212, 255, 0.6);
-            box-shadow: 
-                0 30px 70px rgba(0, 212, 255, 0.4),
-                0 0 0 2px rgba(0, 255, 157, 0.3);
-        }
-
-        .stat-card:hover::after {
-            opacity: 1;
-        }
-
-        .stat-number {
-            font-size: 4.5rem;
-            font-weight: 900;
-            background: linear-gradient(135deg, #00d4ff 0%, #00ff9d 50%, #00d4ff 100%);
-            background-size: 200% 200%;
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            margin-bottom: 15px;
-            animation: gradientText 3s ease infinite;
-            text-shadow: 0 0 30px rgba(0, 212, 255, 0.5);
-            filter: drop-shadow(0 0 20px rgba(0, 255, 157, 0.3));
-        }
-
-        @keyframes gradientText {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-
-        .stat-label {
-            font-size: 1.1rem;
-            opacity: 0.9;
-            font-weight: 500;
-        }
-
-        footer {
-            background: rgba(10, 14, 39, 0.8);
-            backdrop-filter: blur(30px) saturate(180%);
-            padding: 80px 40px 40px;
-            text-align: center;
-            margin-top: 100px;
-            border-top: 2px solid rgba(255, 255, 255, 0.15);
-            box-shadow: 0 -10px 40px rgba(0, 0, 0, 0.3);
-            position: relative;
-            z-index: 2;
-        }
-
-        .footer-content {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        .footer-links {
-            display: flex;
-            justify-content: center;
-            gap: 30px;
-            margin-bottom: 30px;
-            flex-wrap: wrap;
-        }
-
-        .footer-links a {
-            color: #fff;
-            text-decoration: none;
-            opacity: 0.8;
-            transition: opacity 0.3s ease;
-        }
-
-        .footer-links a:hover {
-            opacity: 1;
-        }
-
-        .footer-bottom {
-            padding-top: 30px;
-            border-top: 1px solid rgba(255, 255, 255, 0.1);
-            opacity: 0.7;
-        }
-
-        .hackathon-info {
-            background: linear-gradient(135deg, rgba(255, 215, 0, 0.15), rgba(255, 237, 78, 0.1));
-            backdrop-filter: blur(30px) saturate(180%);
-            padding: 50px 40px;
-            border-radius: 25px;
-            margin: 60px auto;
-            max-width: 900px;
-            text-align: center;
-            border: 2px solid rgba(255, 215, 0, 0.4);
-            box-shadow: 
-                0 20px 60px rgba(255, 215, 0, 0.3),
-                inset 0 1px 0 rgba(255, 255, 255, 0.2);
-            position: relative;
-            overflow: hidden;
-        }
-
-        .hackathon-info::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(45deg, transparent, rgba(255, 215, 0, 0.1), transparent);
-            animation: rotate 10s linear infinite;
-        }
-
-        @keyframes rotate {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .hackathon-info h3 {
-            font-size: 2.5rem;
-            margin-bottom: 20px;
-            background: linear-gradient(135deg, #ffd700, #ffed4e);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-            font-weight: 800;
-            text-shadow: 0 0 30px rgba(255, 215, 0, 0.5);
-            position: relative;
-            z-index: 1;
-        }
-
-        .hackathon-info p {
-            font-size: 1.2rem;
-            opacity: 0.95;
-            line-height: 2;
-            position: relative;
-            z-index: 1;
-            font-weight: 500;
-        }
-    </style>
-</head>
-<body>
-    <nav>
-        <div class="nav-links">
-            <a href="/" class="nav-button" style="font-weight: 600; font-size: 1.2rem;">🏆 CareerSync AI</a>
-            <a href="#features" class="nav-button">Features</a>
-            <a href="#workflow" class="nav-button">How It Works</a>
-            <a href="#awards" class="nav-button">Awards</a>
-        </div>
-        <div class="nav-links">
-            <a href="/login" class="nav-button">Login</a>
-            <a href="/register" class="nav-button primary">Get Started</a>
-        </div>
-    </nav>
-    
-    <div class="award-badge">
-        <div class="trophy">🏆</div>
-        <div class="badge">🏅 FIRST PLACE WINNER - ALLIANCE UNIVERSITY CODE SANGRAM 2025</div>
-        <div class="subtitle">Recognized for Excellence in AI Innovation & Social Impact</div>
-    </div>
-
-    <div class="hero">
-        <h1><span class="title-highlight">CareerSync AI</span></h1>
-        <p style="font-size: 1.8rem; font-weight: 500; margin-bottom: 20px; opacity: 0.95;">Your Gateway to Smarter Job Matching</p>
-        <p class="subtitle" style="font-size: 1.2rem; max-width: 800px; margin: 0 auto 50px; opacity: 0.9; line-height: 1.8;">Empowering job seekers and recruiters with AI-driven solutions for a smarter, fairer, and more sustainable future.</p>
-        <div class="cta-buttons">
-            <a href="/register?type=seeker" class="cta-btn">Find Your Dream Job</a>
-            <a href="/register?type=recruiter" class="cta-btn">Hire the Best Talent</a>
-        </div>
-    </div>
-
-    <div class="stats-section">
-        <div class="stat-card">
-            <div class="stat-number">100%</div>
-            <div class="stat-label">AI-Powered Matching</div>
-        </div>
-        <div class="stat-card">
-            <div class="stat-number">24/7</div>
-            <div class="stat-label">Available Support</div>
-        </div>
-        <div class="stat-card">
-            <div class="stat-number">95%</div>
-            <div class="stat-label">Accuracy Rate</div>
-        </div>
-        <div class="stat-card">
-            <div class="stat-number">1st</div>
-            <div class="stat-label">Place Winner</div>
-        </div>
-    </div>
-
-    <section id="awards" class="hackathon-info">
-        <h3>🏆 Award-Winning Innovation</h3>
-        <p>CareerSync AI emerged victorious at the <strong>Alliance University Code Sangram 2025</strong>, recognized for its innovative approach to AI-driven job matching, sustainable hiring practices, and commitment to inclusive recruitment. Our platform combines cutting-edge technology with a vision for a better future of work.</p>
-    </section>
-    <section id="features">
-        <h2>Key Features</h2>
-        <div class="feature-grid">
-            <div class="feature-card">
-                <h3>Smart Matching</h3>
-                <p>AI-driven skill mapping and predictive career paths using cutting-edge algorithms.</p>
-            </div>
-            <div class="feature-card">
-                <h3>Sustainability Focus</h3>
-                <p>Green job integration and environmental impact tracking for conscious careers.</p>
-            </div>
-            <div class="feature-card">
-                <h3>Inclusive Hiring</h3>
-                <p>Bias-free algorithms and diversity promotion for equal opportunities.</p>
-            </div>
-        </div>
-    </section>
-    <section id="workflow">
-        <h2>How It Works</h2>
-        <ol>
-            <li>
-                <h3>Upload Your Profile</h3>
-                <p>Share your resume or job description with our AI system</p>
-            </li>
-            <li>
-                <h3>AI Analysis</h3>
-                <p>Our advanced AI analyzes skills, experience, and qualifications in real-time</p>
-            </li>
-            <li>
-                <h3>Smart Recommendations</h3>
-                <p>Get personalized job matches or ranked candidate shortlists</p>
-            </li>
-            <li>
-                <h3>Growth Planning</h3>
-                <p>Identify skill gaps and receive tailored upskilling suggestions</p>
-            </li>
-        </ol>
-    </section>
-    <section id="why-us">
-        <h2>Why Choose CareerSync AI?</h2>
-        <div class="why-us-grid">
-            <div class="why-us-card">
-                <h3>For Job Seekers</h3>
-                <ul>
-                    <li>Personalized job recommendations</li>
-                    <li>Skill gap analysis</li>
-                    <li>Access to green job opportunities</li>
-                </ul>
-            </div>
-            <div class="why-us-card">
-                <h3>For Recruiters</h3>
-                <ul>
-                    <li>AI-powered candidate shortlisting</li>
-                    <li>Automated resume parsing</li>
-                    <li>Bias-free hiring algorithms</li>
-                </ul>
-            </div>
-        </div>
-    </section>
-    <section id="how-it-works">
-        <h2>How CareerSync AI Works</h2>
-        <div class="process-steps">
-            <div class="process-step">
-                <h3>1. Upload</h3>
-                <p>Upload your resume or job description</p>
-            </div>
-            <div class="process-step">
-                <h3>2. Analyze</h3>
-                <p>AI analyzes skills and qualifications</p>
-            </div>
-            <div class="process-step">
-                <h3>3. Match</h3>
-                <p>Get personalized recommendations</p>
-            </div>
-            <div class="process-step">
-                <h3>4. Grow</h3>
-                <p>Access upskilling opportunities</p>
-            </div>
-        </div>
-    </section>
-    <section id="testimonials">
-        <h2>What Our Users Say</h2>
-        <div class="testimonials">
-            <div class="testimonial-card">
-                <p>"CareerSync AI helped me find my dream job in just a week! The recommendations were spot on."</p>
-                <h4>- Sarah Johnson</h4>
-                <p class="role">Software Engineer</p>
-            </div>
-            <div class="testimonial-card">
-                <p>"As a recruiter, I saved hours of manual screening. The AI shortlists are incredibly accurate."</p>
-                <h4>- Michael Chen</h4>
-                <p class="role">HR Manager</p>
-            </div>
-        </div>
-    </section>
-    <section id="join-us">
-        <h2>Ready to Get Started?</h2>
-        <p style="font-size: 1.2rem; margin-bottom: 30px;">Whether you're looking for your next big opportunity or the perfect candidate, CareerSync AI is here to help.</p>
-        <a href="/register" class="cta-btn">Sign Up Now</a>
-    </section>
-
-    <footer>
-        <div class="footer-content">
-            <div class="footer-links">
-                <a href="#features">Features</a>
-                <a href="#workflow">How It Works</a>
-                <a href="#awards">Awards</a>
-                <a href="/login">Login</a>
-                <a href="/register">Register</a>
-            </div>
-            <div class="footer-bottom">
-                <p>&copy; 2025 CareerSync AI. Winner of Alliance University Code Sangram 2025.</p>
-                <p style="margin-top: 10px; font-size: 0.9rem;">Built with ❤️ using Flask, Python, and AI</p>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>
-"""
-
-login_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Login - CareerSync AI</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: 'Poppins', sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #4facfe 75%, #00f2fe 100%);
-            background-size: 400% 400%;
-            animation: gradientShift 15s ease infinite;
-            color: #fff;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-            padding: 20px;
-        }
-        @keyframes gradientShift {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-        .login-container {
-            background: rgba(255, 255, 255, 0.15);
-            backdrop-filter: blur(20px);
-            color: #fff;
-            padding: 50px 40px;
-            border-radius: 20px;
-            text-align: center;
-            width: 100%;
-            max-width: 420px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            border: 1px solid rgba(255, 255, 255, 0.3);
-        }
-        .login-container h2 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-            background: linear-gradient(135deg, #fff, #e0e0e0);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-        .login-container .subtitle {
-            font-size: 0.9rem;
-            opacity: 0.8;
-            margin-bottom: 30px;
-        }
-        .login-container input {
-            width: 100%;
-            padding: 15px 20px;
-            margin: 15px 0;
-            border: 2px solid rgba(255, 255, 255, 0.3);
-            border-radius: 10px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #fff;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-        }
-        .login-container input::placeholder {
-            color: rgba(255, 255, 255, 0.6);
-        }
-        .login-container input:focus {
-            outline: none;
-            border-color: rgba(255, 255, 255, 0.6);
-            background: rgba(255, 255, 255, 0.15);
-        }
-        .login-container button {
-            width: 100%;
-            padding: 15px 20px;
-            background: linear-gradient(135deg, #00d4ff, #00ff9d);
-            color: #fff;
-            border: none;
-            border-radius: 10px;
-            cursor: pointer;
-            font-size: 1.1rem;
-            font-weight: 600;
-            margin-top: 10px;
-            transition: all 0.3s ease;
-            box-shadow: 0 10px 30px rgba(0, 212, 255, 0.3);
-        }
-        .login-container button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 15px 40px rgba(0, 212, 255, 0.4);
-        }
-        .error-message {
-            color: #ff6b6b;
-            background: rgba(255, 107, 107, 0.2);
-            padding: 12px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            border: 1px solid rgba(255, 107, 107, 0.3);
-        }
-        .register-link {
-            margin-top: 25px;
-            font-size: 0.95rem;
-            opacity: 0.9;
-        }
-        .register-link a {
-            color: #00ff9d;
-            text-decoration: none;
-            font-weight: 600;
-            transition: opacity 0.3s ease;
-        }
-        .register-link a:hover {
-            opacity: 0.8;
-        }
-        .logo {
-            font-size: 3rem;
-            margin-bottom: 10px;
-        }
-    </style>
-</head>
-<body>
-    <div class="login-container">
-        <div class="logo">🏆</div>
-        <h2>Welcome Back</h2>
-        <p class="subtitle">Login to CareerSync AI</p>
-        <form method="POST">
-            {% if error %}
-                <div class="error-message">{{ error }}</div>
-            {% endif %}
-            <input type="text" name="username" placeholder="Username" required>
-            <input type="password" name="password" placeholder="Password" required>
-            <button type="submit">Login</button>
-        </form>
-        <div class="register-link">
-            Don't have an account? <a href="/register">Register here</a>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-register_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Register - CareerSync AI</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: 'Poppins', sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #4facfe 75%, #00f2fe 100%);
-            background-size: 400% 400%;
-            animation: gradientShift 15s ease infinite;
-            color: #fff;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-            padding: 20px;
-        }
-        @keyframes gradientShift {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-        .register-container {
-            background: rgba(255, 255, 255, 0.15);
-            backdrop-filter: blur(20px);
-            color: #fff;
-            padding: 50px 40px;
-            border-radius: 20px;
-            text-align: center;
-            width: 100%;
-            max-width: 450px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            border: 1px solid rgba(255, 255, 255, 0.3);
-        }
-        .register-container h2 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-            background: linear-gradient(135deg, #fff, #e0e0e0);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-        .register-container .subtitle {
-            font-size: 0.9rem;
-            opacity: 0.8;
-            margin-bottom: 30px;
-        }
-        .register-container input, .register-container select {
-            width: 100%;
-            padding: 15px 20px;
-            margin: 15px 0;
-            border: 2px solid rgba(255, 255, 255, 0.3);
-            border-radius: 10px;
-            background: rgba(255, 255, 255, 0.1);
-            color: #fff;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-        }
-        .register-container select {
-            cursor: pointer;
-        }
-        .register-container select option {
-            background: #667eea;
-            color: #fff;
-        }
-        .register-container input::placeholder {
-            color: rgba(255, 255, 255, 0.6);
-        }
-        .register-container input:focus, .register-container select:focus {
-            outline: none;
-            border-color: rgba(255, 255, 255, 0.6);
-            background: rgba(255, 255, 255, 0.15);
-        }
-        .register-container button {
-            width: 100%;
-            padding: 15px 20px;
-            background: linear-gradient(135deg, #00d4ff, #00ff9d);
-            color: #fff;
-            border: none;
-            border-radius: 10px;
-            cursor: pointer;
-            font-size: 1.1rem;
-            font-weight: 600;
-            margin-top: 10px;
-            transition: all 0.3s ease;
-            box-shadow: 0 10px 30px rgba(0, 212, 255, 0.3);
-        }
-        .register-container button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 15px 40px rgba(0, 212, 255, 0.4);
-        }
-        .error-message {
-            color: #ff6b6b;
-            background: rgba(255, 107, 107, 0.2);
-            padding: 12px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            border: 1px solid rgba(255, 107, 107, 0.3);
-        }
-        .login-link {
-            margin-top: 25px;
-            font-size: 0.95rem;
-            opacity: 0.9;
-        }
-        .login-link a {
-            color: #00ff9d;
-            text-decoration: none;
-            font-weight: 600;
-            transition: opacity 0.3s ease;
-        }
-        .login-link a:hover {
-            opacity: 0.8;
-        }
-        .logo {
-            font-size: 3rem;
-            margin-bottom: 10px;
-        }
-    </style>
-</head>
-<body>
-    <div class="register-container">
-        <div class="logo">🚀</div>
-        <h2>Get Started</h2>
-        <p class="subtitle">Join CareerSync AI today</p>
-        <form method="POST">
-            {% if error %}
-                <div class="error-message">{{ error }}</div>
-            {% endif %}
-            <input type="text" name="username" placeholder="Username" required>
-            <input type="password" name="password" placeholder="Password" required>
-            <select name="role" required>
-                <option value="">Select Your Role</option>
-                <option value="job_seeker">Job Seeker</option>
-                <option value="recruiter">Recruiter</option>
-            </select>
-            <button type="submit">Create Account</button>
-        </form>
-        <div class="login-link">
-            Already have an account? <a href="/login">Login here</a>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-# First, define common_skills globally at the top of your file
+# Larger requests are rejected with 413 while they stream in
+app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024
+
+# Uploaded files are hashed as Werkzeug streams them in. Small files stay in
+# memory; larger ones spill to a uniquely named file in uploads/, so parallel
+# uploads never collide. The spill file is removed when the request closes
+# unless the resume pool has taken it over with detach().
+UPLOAD_MEMORY_LIMIT = 512 * 1024
+
+class HashingUpload:
+    def __init__(self):
+        self.digest = hashlib.sha256()
+        self.file = io.BytesIO()
+        self.path = None
+
+    def write(self, data):
+        metrics.inc('careersync_upload_bytes_total', len(data))
+        self.digest.update(data)
+        if self.path is None and self.file.tell() + len(data) > UPLOAD_MEMORY_LIMIT:
+            fd, self.path = tempfile.mkstemp(suffix='.upload', dir=UPLOAD_FOLDER)
+            spill = os.fdopen(fd, 'w+b')
+            spill.write(self.file.getvalue())
+            self.file = spill
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+    def detach(self):
+        self.file.close()
+        self.path = None
+
+    def close(self):
+        self.file.close()
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return HashingUpload()
+
+app.request_class = UploadRequest
+
+# Skill taxonomy shared by resume extraction and job matching
 common_skills = {
     'python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular',
     'node.js', 'docker', 'kubernetes', 'aws', 'azure', 'machine learning',
@@ -1319,819 +668,334 @@ common_skills = {
     'communication', 'problem solving', 'teamwork', 'git', 'devops'
 }
 
-# Update the dashboard_page template
-dashboard_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard - CareerSync AI</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: 
-                linear-gradient(120deg, rgba(0,0,0,0.7), rgba(0,0,0,0.4)),
-                url('https://images.unsplash.com/photo-1497215728101-856f4ea42174?ixlib=rb-1.2.1&auto=format&fit=crop&w=1950&q=80');
-            background-size: cover;
-            background-attachment: fixed;
-            background-position: center;
-            color: #fff;
-            min-height: 100vh;
-        }
-        nav {
-            display: flex;
-            justify-content: space-between;
-            padding: 15px 30px;
-            background: rgba(0, 0, 0, 0.8);
-            backdrop-filter: blur(10px);
-        }
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 10px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-            background: rgba(255, 255, 255, 0.1);
-        }
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.2);
-            transform: translateY(-2px);
-        }
-        .container {
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-        }
-        .upload-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .upload-section h2 {
-            margin-bottom: 20px;
-            color: #fff;
-        }
-        .file-upload {
-            display: none;
-        }
-        .upload-btn {
-            display: inline-block;
-            padding: 12px 24px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: #fff;
-            border-radius: 25px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            margin-bottom: 15px;
-        }
-        .upload-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .submit-btn {
-            padding: 12px 30px;
-            background: #00ff9d;
-            color: #fff;
-            border: none;
-            border-radius: 25px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: all 0.3s ease;
-        }
-        .submit-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-        .skills-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            margin-top: 30px;
-        }
-        .skills-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        .skill-item {
-            background: rgba(255, 255, 255, 0.2);
-            padding: 10px;
-            border-radius: 10px;
-            text-align: center;
-            transition: all 0.3s ease;
-        }
-        .skill-item:hover {
-            transform: translateY(-3px);
-            background: rgba(255, 255, 255, 0.3);
-        }
-        #selected-file {
-            margin-top: 10px;
-            color: #fff;
-        }
-        .error-message {
-            color: #ff6b6b;
-            margin-top: 10px;
-        }
-        .filters-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            margin: 20px 0;
-            backdrop-filter: blur(10px);
-        }
-        .filters-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        .filter-group select {
-            width: 100%;
-            padding: 10px;
-            border-radius: 8px;
-            border: none;
-            background: rgba(255, 255, 255, 0.9);
-        }
-        .apply-filters {
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            padding: 10px 20px;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        .job-item {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            margin-bottom: 20px;
-            backdrop-filter: blur(10px);
-        }
-        .job-actions {
-            display: flex;
-            gap: 10px;
-            margin-top: 15px;
-        }
-        .view-details, .match-skills {
-            padding: 8px 15px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            color: white;
-        }
-        .view-details {
-            background: #00d4ff;
-        }
-        .match-skills {
-            background: #00ff9d;
-        }
-        .modal {
-            display: none;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            z-index: 1000;
-        }
-        .modal-content {
-            background: white;
-            padding: 20px;
-            border-radius: 15px;
-            width: 80%;
-            max-width: 800px;
-            margin: 50px auto;
-            color: #333;
-            position: relative;
-        }
-        .close-modal {
-            position: absolute;
-            right: 20px;
-            top: 20px;
-            font-size: 24px;
-            cursor: pointer;
-        }
-        .skills-match {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-top: 10px;
-        }
-        .percentage-bar {
-            width: 200px;
-            height: 20px;
-            background: #ddd;
-            border-radius: 10px;
-            overflow: hidden;
-        }
-        .percentage-fill {
-            height: 100%;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            width: 0%;
-            transition: width 1s ease-in-out;
-        }
-        .recruiter-section {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 30px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-            text-align: center;
-            margin: 30px 0;
-        }
-        .recruiter-buttons {
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            margin-top: 20px;
-        }
-        .recruiter-btn {
-            padding: 15px 30px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            color: white;
-            text-decoration: none;
-            border-radius: 25px;
-            font-weight: bold;
-            transition: all 0.3s ease;
-        }
-        .recruiter-btn:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-        }
-    </style>
-</head>
-<body>
-    <nav>
-        <a href="/">Home</a>
-        <a href="/logout">Logout</a>
-    </nav>
-    <div class="container">
-        <h1>Welcome to {{ role }}</h1>
-        {% if role == "Job Seeker Dashboard" %}
-        <div class="upload-section">
-            <h2>Upload Your Resume</h2>
-            <form action="/upload_resume" method="POST" enctype="multipart/form-data">
-                <input type="file" name="resume" id="resume" class="file-upload" accept=".pdf,.doc,.docx">
-                <label for="resume" class="upload-btn">Choose File</label>
-                <div id="selected-file">No file chosen</div>
-                {% if error %}
-                    <div class="error-message">{{ error }}</div>
-                {% endif %}
-                <button type="submit" class="submit-btn">Analyze Resume</button>
-            </form>
-        </div>
-
-        {% if skills %}
-        <div class="skills-section">
-            <h2>Extracted Skills</h2>
-            <div class="skills-grid">
-                {% for skill in skills %}
-                    <div class="skill-item">{{ skill }}</div>
-                {% endfor %}
-            </div>
-        </div>
-
-        <div class="filters-section">
-            <h2>Filter Jobs</h2>
-            <div class="filters-grid">
-                <div class="filter-group">
-                    <select id="location-filter">
-                        <option value="">Select Location</option>
-                        <option value="Mumbai">Mumbai</option>
-                        <option value="Delhi">Delhi</option>
-                        <option value="Bangalore">Bangalore</option>
-                        <option value="Hyderabad">Hyderabad</option>
-                        <option value="Chennai">Chennai</option>
-                        <option value="Kolkata">Kolkata</option>
-                        <option value="Pune">Pune</option>
-                        <option value="Ahmedabad">Ahmedabad</option>
-                    </select>
-                </div>
-                <div class="filter-group">
-                    <select id="job-type-filter">
-                        <option value="">Select Job Type</option>
-                        <option value="Full-time">Full-time</option>
-                        <option value="Part-time">Part-time</option>
-                        <option value="Contract">Contract</option>
-                        <option value="Freelance">Freelance</option>
-                        <option value="Internship">Internship</option>
-                        <option value="Remote">Remote</option>
-                    </select>
-                </div>
-                <div class="filter-group">
-                    <select id="experience-filter">
-                        <option value="">Select Experience</option>
-                        <option value="Fresher">Fresher (0 years)</option>
-                        <option value="0-1 year">0-1 year</option>
-                        <option value="1-2 years">1-2 years</option>
-                        <option value="2-3 years">2-3 years</option>
-                        <option value="3-5 years">3-5 years</option>
-                        <option value="5-7 years">5-7 years</option>
-                        <option value="7-10 years">7-10 years</option>
-                        <option value="10+ years">10+ years</option>
-                    </select>
-                </div>
-            </div>
-            <button onclick="applyFilters()" class="apply-filters">Apply Filters</button>
-        </div>
-
-        <div id="jobs-container">
-            <!-- Jobs will be populated here -->
-        </div>
-        {% endif %}
-        {% elif role == "Recruiter Dashboard" %}
-        <div class="recruiter-section">
-            <h2>Manage Job Postings</h2>
-            <div class="recruiter-buttons">
-                <a href="/post_job" class="recruiter-btn">Post New Job</a>
-                <a href="/view_jobs" class="recruiter-btn">View Posted Jobs</a>
-            </div>
-        </div>
-        {% endif %}
-    </div>
-
-    <!-- Modal for job details -->
-    <div id="jobModal" class="modal">
-        <div class="modal-content">
-            <span class="close-modal" onclick="closeModal()">&times;</span>
-            <div id="modalContent"></div>
-        </div>
-    </div>
-
-    <script>
-        // Store user skills globally
-        const userSkills = {{ skills|tojson if skills else '[]' }};
-
-        // Handle file upload display
-        document.getElementById('resume').addEventListener('change', function(e) {
-            var fileName = e.target.files[0] ? e.target.files[0].name : 'No file chosen';
-            document.getElementById('selected-file').textContent = fileName;
-        });
-
-        async function applyFilters() {
-            const location = document.getElementById('location-filter').value;
-            const jobType = document.getElementById('job-type-filter').value;
-            const experience = document.getElementById('experience-filter').value;
-
-            try {
-                const response = await fetch('/filter_jobs', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        location: location,
-                        job_type: jobType,
-                        experience: experience
-                    })
-                });
-
-                const jobs = await response.json();
-                displayJobs(jobs);
-            } catch (error) {
-                console.error('Error:', error);
-            }
-        }
-
-        function displayJobs(jobs) {
-            const container = document.getElementById('jobs-container');
-            container.innerHTML = '';
-
-            jobs.forEach(job => {
-                const jobElement = document.createElement('div');
-                jobElement.className = 'job-item';
-                jobElement.innerHTML = `
-                    <h3>${job.role_name}</h3>
-                    <h4>${job.company_name}</h4>
-                    <p>📍 ${job.location} | 💼 ${job.job_type}</p>
-                    <p><strong>Experience:</strong> ${job.experience}</p>
-                    <div class="job-actions">
-                        <button class="view-details" onclick="viewJobDetails(${job.id})">View Details</button>
-                        <button class="match-skills" onclick="matchSkills(${job.id})">Match Skills</button>
-                    </div>
-                    <div id="skills-match-${job.id}" class="skills-match"></div>
-                `;
-                container.appendChild(jobElement);
-            });
-        }
-
-        function viewJobDetails(jobId) {
-            fetch(`/job_details/${jobId}`)
-                .then(response => response.json())
-                .then(job => {
-                    document.getElementById('modalContent').innerHTML = `
-                        <h2>${job.role_name}</h2>
-                        <h3>${job.company_name}</h3>
-                        <p><strong>Location:</strong> ${job.location}</p>
-                        <p><strong>Job Type:</strong> ${job.job_type}</p>
-                        <p><strong>Experience Required:</strong> ${job.experience}</p>
-                        <p><strong>Description:</strong></p>
-                        <p>${job.description}</p>
-                        <p><strong>Qualifications:</strong></p>
-                        <p>${job.qualifications}</p>
-                    `;
-                    document.getElementById('jobModal').style.display = 'block';
-                });
-        }
-
-        function closeModal() {
-            document.getElementById('jobModal').style.display = 'none';
-        }
-
-        function matchSkills(jobId) {
-            fetch(`/match_skills/${jobId}`)
-                .then(response => response.json())
-                .then(result => {
-                    const matchElement = document.getElementById(`skills-match-${jobId}`);
-                    matchElement.innerHTML = `
-                        <span>${result.percentage}% Match</span>
-                        <div class="percentage-bar">
-                            <div class="percentage-fill" style="width: 0%"></div>
-                        </div>
-                    `;
-                    // Animate the percentage bar
-                    setTimeout(() => {
-                        matchElement.querySelector('.percentage-fill').style.width = `${result.percentage}%`;
-                    }, 100);
-                });
-        }
-
-        // Close modal when clicking outside
-        window.onclick = function(event) {
-            if (event.target == document.getElementById('jobModal')) {
-                closeModal();
-            }
-        }
-
-        // Load jobs initially if skills are present
-        if (userSkills.length > 0) {
-            applyFilters();
-        }
-    </script>
-</body>
-</html>
-"""
-
-post_job_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Post a Job </title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(120deg, #ff9a9e, #fad0c4, #fbc2eb, #a18cd1);
-            background-size: 400% 400%;
-            animation: gradientBG 10s ease infinite;
-            min-height: 100vh;
-            color: #fff;
-        }
-
-        @keyframes gradientBG {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .container {
-            max-width: 800px;
-            margin: 80px auto;
-            padding: 30px;
-            background: rgba(0, 0, 0, 0.7);
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-        }
-
-        h1 {
-            text-align: center;
-            margin-bottom: 30px;
-            color: #fff;
-        }
-
-        form {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-
-        .form-group {
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-        }
-
-        label {
-            font-weight: bold;
-            color: #fff;
-        }
-
-        input, textarea {
-            padding: 12px;
-            border: none;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.9);
-            font-size: 16px;
-        }
-
-        textarea {
-            min-height: 120px;
-            resize: vertical;
-        }
-
-        button {
-            padding: 15px;
-            background: linear-gradient(45deg, #00d4ff, #00ff9d);
-            border: none;
-            border-radius: 8px;
-            color: #fff;
-            font-size: 16px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-
-        button:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-
-        nav {
-            position: fixed;
-            top: 0;
-            width: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            padding: 15px 0;
-            backdrop-filter: blur(10px);
-        }
-
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 15px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-        }
-
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.1);
-        }
-
-        select {
-            padding: 12px;
-            border: none;
-            border-radius: 8px;
-            background: rgba(255, 255, 255, 0.9);
-            font-size: 16px;
-            width: 100%;
-        }
-
-        .form-row {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-        }
-    </style>
-</head>
-<body>
-    <nav>
-        <a href="/dashboard">Dashboard</a>
-        <a href="/logout">Logout</a>
-    </nav>
-    <div class="container">
-        <h1>Post a New Job</h1>
-        <form method="POST">
-            <div class="form-group">
-                <label for="company_name">Company Name</label>
-                <input type="text" id="company_name" name="company_name" required>
-            </div>
-            <div class="form-group">
-                <label for="role_name">Role Name</label>
-                <input type="text" id="role_name" name="role_name" required>
-            </div>
-            <div class="form-row">
-                <div class="form-group">
-                    <label for="location">Location</label>
-                    <select id="location" name="location" required>
-                        <option value="">Select a city</option>
-                        <option value="Mumbai">Mumbai</option>
-                        <option value="Delhi">Delhi</option>
-                        <option value="Bangalore">Bangalore</option>
-                        <option value="Hyderabad">Hyderabad</option>
-                        <option value="Chennai">Chennai</option>
-                        <option value="Kolkata">Kolkata</option>
-                        <option value="Pune">Pune</option>
-                        <option value="Ahmedabad">Ahmedabad</option>
-                        <option value="Surat">Surat</option>
-                        <option value="Jaipur">Jaipur</option>
-                        <option value="Lucknow">Lucknow</option>
-                        <option value="Kanpur">Kanpur</option>
-                        <option value="Nagpur">Nagpur</option>
-                        <option value="Indore">Indore</option>
-                        <option value="Thane">Thane</option>
-                        <option value="Bhopal">Bhopal</option>
-                        <option value="Visakhapatnam">Visakhapatnam</option>
-                        <option value="Noida">Noida</option>
-                        <option value="Gurugram">Gurugram</option>
-                    </select>
-                </div>
-                <div class="form-group">
-                    <label for="job_type">Job Type</label>
-                    <select id="job_type" name="job_type" required>
-                        <option value="">Select job type</option>
-                        <option value="Full-time">Full-time</option>
-                        <option value="Part-time">Part-time</option>
-                        <option value="Contract">Contract</option>
-                        <option value="Freelance">Freelance</option>
-                        <option value="Internship">Internship</option>
-                        <option value="Remote">Remote</option>
-                    </select>
-                </div>
-            </div>
-            <div class="form-group">
-                <label for="description">Job Description</label>
-                <textarea id="description" name="description" required></textarea>
-            </div>
-            <div class="form-group">
-                <label for="qualifications">Required Qualifications</label>
-                <textarea id="qualifications" name="qualifications" required></textarea>
-            </div>
-            <div class="form-group">
-                <label for="experience">Required Experience</label>
-                <select id="experience" name="experience" required>
-                    <option value="">Select required experience</option>
-                    <option value="Fresher">Fresher (0 years)</option>
-                    <option value="0-1 year">0-1 year</option>
-                    <option value="1-2 years">1-2 years</option>
-                    <option value="2-3 years">2-3 years</option>
-                    <option value="3-5 years">3-5 years</option>
-                    <option value="5-7 years">5-7 years</option>
-                    <option value="7-10 years">7-10 years</option>
-                    <option value="10+ years">10+ years</option>
-                </select>
-            </div>
-            <button type="submit">Post Job</button>
-        </form>
-    </div>
-</body>
-</html>
-"""
-
-view_jobs_page = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>View Jobs </title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: linear-gradient(120deg, #ff9a9e, #fad0c4, #fbc2eb, #a18cd1);
-            background-size: 400% 400%;
-            animation: gradientBG 10s ease infinite;
-            min-height: 100vh;
-            color: #fff;
-        }
-
-        @keyframes gradientBG {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 80px auto;
-            padding: 20px;
-        }
-
-        .jobs-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 20px;
-        }
-
-        .job-card {
-            background: rgba(0, 0, 0, 0.7);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            transition: transform 0.3s ease;
-        }
-
-        .job-card:hover {
-            transform: translateY(-5px);
-        }
-
-        .job-card h3 {
-            color: #00d4ff;
-            margin-bottom: 10px;
-        }
-
-        .job-card h4 {
-            color: #00ff9d;
-            margin-bottom: 15px;
-        }
-
-        .job-card p {
-            margin: 10px 0;
-            color: #fff;
-        }
-
-        nav {
-            position: fixed;
-            top: 0;
-            width: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            padding: 15px 0;
-            backdrop-filter: blur(10px);
-            z-index: 1000;
-        }
-
-        nav a {
-            color: #fff;
-            text-decoration: none;
-            margin: 0 15px;
-            padding: 8px 15px;
-            border-radius: 20px;
-            transition: all 0.3s ease;
-        }
-
-        nav a:hover {
-            background: rgba(255, 255, 255, 0.1);
-        }
-
-        h1 {
-            text-align: center;
-            margin-bottom: 30px;
-            color: #fff;
-        }
-
-        .job-meta {
-            display: flex;
-            gap: 15px;
-            margin: 10px 0;
-            color: #00ff9d;
-            font-size: 0.9em;
-        }
-
-        .job-meta span {
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-    </style>
-</head>
-<body>
-    <nav>
-        <a href="/dashboard">Dashboard</a>
-        <a href="/logout">Logout</a>
-    </nav>
-    <div class="container">
-        <h1>Available Jobs</h1>
-        <div class="jobs-grid">
-            {% for job in jobs %}
-            <div class="job-card">
-                <h3>{{ job[2] }}</h3>
-                <h4>{{ job[1] }}</h4>
-                <div class="job-meta">
-                    <span>📍 {{ job[6] }}</span>
-                    <span>💼 {{ job[7] }}</span>
-                </div>
-                <p><strong>Description:</strong> {{ job[3] }}</p>
-                <p><strong>Qualifications:</strong> {{ job[4] }}</p>
-                <p><strong>Experience:</strong> {{ job[5] }}</p>
-            </div>
-            {% endfor %}
-        </div>
-    </div>
-</body>
-</html>
-"""
+# Aho-Corasick automaton over the taxonomy. It is built once at import time and
+# finds every skill in a single pass over the text, so the cost of a scan grows
+# with the length of the document rather than with the size of the taxonomy.
+class SkillMatcher:
+    def __init__(self, terms):
+        self.terms = sorted({term.lower() for term in terms})
+        self.ids = {term: index for index, term in enumerate(self.terms)}
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for index, term in enumerate(self.terms):
+            state = 0
+            for char in term:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += ((term, len(term)),)
+
+        # Breadth-first walk to wire up the failure links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def find(self, text, found=None):
+        # Only whole-word hits count, so 'java' is not found inside 'javascript'
+        if found is None:
+            found = set()
+        text = text.lower()
+        last = len(text) - 1
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] and (position == last or not text[position + 1].isalnum()):
+                for term, length in output[state]:
+                    start = position - length
+                    if start < 0 or not text[start].isalnum():
+                        found.add(term)
+        return found
+
+skill_matcher = SkillMatcher(common_skills)
+
+# Register the taxonomy in the skills table and load name -> id. Terms added
+# to common_skills get the next free id; existing ids never change.
+def load_skill_ids():
+    conn = connect_db()
+    conn.executemany('INSERT OR IGNORE INTO skills (name) VALUES (?)',
+                     [(term,) for term in skill_matcher.terms])
+    conn.commit()
+    ids = dict(conn.execute('SELECT name, id FROM skills').fetchall())
+    conn.close()
+    return ids
+
+skill_ids = load_skill_ids()
+
+# Sparse row x skill incidence matrix over the taxonomy, kept as coordinate
+# arrays. Scoring every row against a skill set is a single sparse
+# matrix-vector product (one np.bincount) instead of a loop of set intersections.
+class SkillMatrix:
+    def __init__(self, pairs):
+        row_ids, rows, cols = [], [], []
+        for row_id, skill in pairs:
+            col = skill_matcher.ids.get(skill)
+            if col is None:
+                continue
+            if not row_ids or row_ids[-1] != row_id:
+                row_ids.append(row_id)
+            rows.append(len(row_ids) - 1)
+            cols.append(col)
+        self.ids = np.array(row_ids, dtype=np.int64)
+        self.rows = np.array(rows, dtype=np.int32)
+        self.cols = np.array(cols, dtype=np.int32)
+        self.totals = np.bincount(self.rows, minlength=len(self.ids))
+
+    # A new matrix with the rows for pairs added after this one's, whose ids
+    # must all be larger. This matrix is left as is for concurrent readers.
+    def extend(self, pairs):
+        extra = SkillMatrix(pairs)
+        matrix = SkillMatrix([])
+        matrix.ids = np.concatenate([self.ids, extra.ids])
+        matrix.rows = np.concatenate([self.rows, extra.rows + len(self.ids)])
+        matrix.cols = np.concatenate([self.cols, extra.cols])
+        matrix.totals = np.concatenate([self.totals, extra.totals])
+        return matrix
+
+    def vector(self, skills):
+        query = np.zeros(len(skill_matcher.terms), dtype=np.float32)
+        for skill in skills:
+            if skill in skill_matcher.ids:
+                query[skill_matcher.ids[skill]] = 1
+        return query
+
+    # How many of the given skills each row has
+    def hits(self, skills):
+        return np.bincount(self.rows, weights=self.vector(skills)[self.cols], minlength=len(self.ids))
+
+    # The given skills that one row has, sorted
+    def matching(self, row, skills):
+        start, end = np.searchsorted(self.rows, [row, row + 1])
+        query = self.vector(skills)
+        return sorted(skill_matcher.terms[col] for col in self.cols[start:end] if query[col])
+
+    def score(self, skills):
+        # Same percentage as score_skills: share of each row's skills matched
+        hits = self.hits(skills)
+        percentages = np.zeros(len(self.ids))
+        np.divide(hits * 100, self.totals, out=percentages, where=self.totals > 0)
+        return np.round(percentages).astype(np.int64)
+
+# CSS and JS under static/ are fingerprinted with a content hash and
+# compressed once at startup. Templates link to them through asset_url, and
+# because a fingerprinted URL never changes content it is cached for a year.
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+# Bodies built once up front are compressed with the strongest settings,
+# keeping only the encodings that actually shrink them
+def precompress(body):
+    variants = {
+        'br': brotli.compress(body, quality=11),
+        'gzip': gzip.compress(body, compresslevel=9),
+    }
+    variants = {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+    variants['identity'] = body
+    return variants
+
+# The client's preferred encoding among a precompressed body's variants
+def pick_encoding(variants):
+    for candidate in ('br', 'gzip'):
+        if candidate in variants and request.accept_encodings[candidate]:
+            return candidate
+    return 'identity'
+
+def build_assets():
+    manifest = {}
+    assets = {}
+    for folder, _, filenames in os.walk(app.static_folder):
+        for filename in filenames:
+            path = os.path.join(folder, filename)
+            name = os.path.relpath(path, app.static_folder).replace(os.sep, '/')
+            with open(path, 'rb') as file:
+                body = file.read()
+            stem, extension = os.path.splitext(name)
+            fingerprinted = f'{stem}.{hashlib.sha256(body).hexdigest()[:12]}{extension}'
+            manifest[name] = fingerprinted
+            assets[fingerprinted] = (mimetypes.guess_type(name)[0], precompress(body))
+    return manifest, assets
+
+asset_manifest, assets = build_assets()
+
+@app.template_global()
+def asset_url(name):
+    return url_for('asset', filename=asset_manifest[name])
+
+@app.route('/assets/<path:filename>')
+def asset(filename):
+    if filename not in assets:
+        abort(404)
+    mimetype, variants = assets[filename]
+    encoding = pick_encoding(variants)
+    response = app.response_class(variants[encoding], mimetype=mimetype)
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+# WSGI middleware that compresses responses with brotli or gzip, whichever the
+# client prefers. Small, non-text and already-encoded responses pass through.
+# Responses with an ETag are cacheable, so their compressed bodies are kept in
+# an LRU cache; everything else is compressed chunk by chunk as it streams out.
+# Both happen on the request path and use fast settings; bodies that are built
+# at startup (assets and static pages) arrive precompressed and pass through.
+COMPRESS_MIN_SIZE = 1024
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript')
+
+class CompressionMiddleware:
+    def __init__(self, wsgi_app, cache_size=256):
+        self.wsgi_app = wsgi_app
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        accept = parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING'))
+        encoding = next((name for name in ('br', 'gzip') if accept[name]), None)
+        if encoding is None or environ['REQUEST_METHOD'] == 'HEAD':
+            return self.wsgi_app(environ, start_response)
+
+        captured = []
+        def capture(status, headers, exc_info=None):
+            captured[:] = [status, headers, exc_info]
+        app_iter = self.wsgi_app(environ, capture)
+        status, headers, exc_info = captured
+        header_map = Headers(headers)
+        length = header_map.get('Content-Length', type=int)
+
+        if (not status.startswith('200')
+                or 'Content-Encoding' in header_map
+                or not header_map.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES)
+                or (length is not None and length < COMPRESS_MIN_SIZE)):
+            start_response(status, headers, exc_info)
+            return app_iter
+
+        etag = header_map.get('ETag')
+        header_map.remove('Content-Length')
+        header_map['Content-Encoding'] = encoding
+        header_map.add('Vary', 'Accept-Encoding')
+        if etag:
+            # The compressed body is a different representation, so its
+            # validator can only be weak (werkzeug compares If-None-Match weakly)
+            header_map['ETag'] = etag if etag.startswith('W/') else 'W/' + etag
+            body = self.cached_body(environ, etag, encoding, app_iter)
+            header_map['Content-Length'] = str(len(body))
+            start_response(status, header_map.to_wsgi_list(), exc_info)
+            return [body]
+
+        start_response(status, header_map.to_wsgi_list(), exc_info)
+        return self.stream(app_iter, encoding)
+
+    def cached_body(self, environ, etag, encoding, app_iter):
+        key = (environ.get('PATH_INFO'), environ.get('QUERY_STRING'), etag, encoding)
+        with self.lock:
+            body = self.cache.get(key)
+            if body is not None:
+                self.cache.move_to_end(key)
+        metrics.cache_lookup('compression', body is not None)
+        if body is not None:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+            return body
+
+        try:
+            data = b''.join(app_iter)
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+        if encoding == 'br':
+            body = brotli.compress(data, quality=5)
+        else:
+            body = gzip.compress(data, compresslevel=6)
+        with self.lock:
+            self.cache[key] = body
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return body
+
+    def stream(self, app_iter, encoding):
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=5)
+            compress, finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            compress, finish = compressor.compress, compressor.flush
+        try:
+            for chunk in app_iter:
+                data = compress(chunk)
+                if data:
+                    yield data
+            yield finish()
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+app.wsgi_app = CompressionMiddleware(app.wsgi_app)
+
+# Compile every template up front so no request pays for it
+def compile_templates():
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+compile_templates()
+
+# Pages that are the same for every visitor are rendered and precompressed once
+# per process and served from memory with an ETag, so repeat visits, crawlers
+# and health checks get a 304 or a cached body without touching Jinja
+STATIC_PAGE_MAX_AGE = 300
+static_pages = {}
+
+def static_page(template):
+    page = static_pages.get(template)
+    metrics.cache_lookup('static_page', page is not None)
+    if page is None:
+        body = render_template(template).encode()
+        page = static_pages[template] = (precompress(body), hashlib.sha256(body).hexdigest()[:32])
+    variants, etag = page
+    encoding = pick_encoding(variants)
+    response = app.response_class(variants[encoding], mimetype='text/html')
+    # An encoded body is another representation of the page, so its validator is weak
+    response.set_etag(etag, weak=encoding != 'identity')
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_PAGE_MAX_AGE
+    return response.make_conditional(request)
+
+# The session cookie carries only the user id; the rest of the account is
+# read once per request and kept on g
+def current_user():
+    if 'user' not in g:
+        g.user = None
+        if 'user_id' in session:
+            cursor = get_db().cursor()
+            cursor.execute('SELECT id, username, role FROM users WHERE id = ?', (session['user_id'],))
+            g.user = cursor.fetchone()
+    return g.user
 
 # Routes
 @app.route('/')
 def home():
-    return render_template_string(home_page)
+    return static_page('home.html')
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
@@ -2140,47 +1004,47 @@ def register():
         password = request.form['password']
         role = request.form['role']
         
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
         
         try:
             cursor.execute('INSERT INTO users (username, password, role) VALUES (?, ?, ?)',
                          (username, password, role))
             conn.commit()
-            conn.close()
             return redirect(url_for('login'))
         except sqlite3.IntegrityError:
-            conn.close()
-            return render_template_string(register_page, error="Username already exists")
+            return render_template('register.html', error="Username already exists")
         
-    return render_template_string(register_page)
+    return static_page('register.html')
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM users WHERE username = ? AND password = ?', (username, password))
         user = cursor.fetchone()
-        conn.close()
         if user:
-            session['username'] = user[1]
-            session['role'] = user[3]
+            session.clear()
+            session['user_id'] = user[0]
             return redirect(url_for('dashboard'))
         else:
-            return render_template_string(login_page, error="Invalid credentials")
-    return render_template_string(login_page)
+            return render_template('login.html', error="Invalid credentials")
+    return static_page('login.html')
 
 @app.route('/dashboard')
 def dashboard():
-    if 'username' in session:
-        role = session['role']
+    user = current_user()
+    if user:
+        role = user[2]
         if role == 'job_seeker':
-            return render_template_string(dashboard_page, role="Job Seeker Dashboard")
+            skills = [skill.title() for skill in sorted(get_user_skills())]
+            return render_template('dashboard.html', role="Job Seeker Dashboard",
+                                   skills=skills, task=request.args.get('task'))
         elif role == 'recruiter':
-            return render_template_string(dashboard_page, role="Recruiter Dashboard")
+            return render_template('dashboard.html', role="Recruiter Dashboard")
     return redirect(url_for('login'))
 
 @app.route('/logout')
@@ -2188,77 +1052,316 @@ def logout():
     session.clear()
     return redirect(url_for('home'))
 
-# Update the upload_resume route to store skills in session
+# Save the resume and queue it for skill extraction; /resume_status reports the result
 @app.route('/upload_resume', methods=['POST'])
 def upload_resume():
-    if 'username' not in session or session['role'] != 'job_seeker':
+    user = current_user()
+    if user is None or user[2] != 'job_seeker':
         return redirect(url_for('login'))
 
     if 'resume' not in request.files:
-        return render_template_string(dashboard_page, 
+        return render_template('dashboard.html', 
                                    role="Job Seeker Dashboard", 
                                    error="No file uploaded")
 
     file = request.files['resume']
     if file.filename == '':
-        return render_template_string(dashboard_page, 
+        return render_template('dashboard.html', 
                                    role="Job Seeker Dashboard", 
                                    error="No file selected")
 
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Extract skills from resume
-        skills = extract_skills(filepath)
+        # Re-uploads of a file we have already parsed are answered from the cache
+        upload = file.stream
+        digest = upload.digest.hexdigest()
+        skills = cached_resume_skills(digest)
+        if skills is not None:
+            conn = get_db()
+            save_user_skills(conn, user[0], skills)
+            conn.commit()
+            if request.accept_mimetypes.best == 'application/json':
+                return jsonify({'status': 'done', 'skills': skills})
+            return redirect(url_for('dashboard'))
         
-        # Store skills in session
-        session['skills'] = skills
+        if not resume_slots.acquire(blocking=False):
+            return render_template('dashboard.html', 
+                                   role="Job Seeker Dashboard", 
+                                   error="We are analyzing a lot of resumes right now, please try again shortly"), 503
         
-        # Delete the file after processing
-        os.remove(filepath)
+        try:
+            task_id = uuid.uuid4().hex
+            conn = get_db()
+            conn.execute('DELETE FROM resume_tasks WHERE created_at < ?', (time.time() - RESUME_TASK_TTL,))
+            conn.execute('INSERT INTO resume_tasks (id, username, status, created_at) VALUES (?, ?, ?, ?)',
+                         (task_id, user[1], 'pending', time.time()))
+            conn.commit()
+            
+            # Small files go to the pool as bytes; larger ones are already on disk
+            # and the pool process deletes them when it is done, or the web
+            # worker does if the pool process died first
+            if upload.path is None:
+                source = upload.getvalue()
+            else:
+                upload.flush()
+                source = upload.path
+            try:
+                future = get_resume_pool().submit(parse_resume, source, file.filename)
+            except BrokenProcessPool:
+                future = get_resume_pool(restart=True).submit(parse_resume, source, file.filename)
+            upload.detach()
+        except Exception:
+            resume_slots.release()
+            raise
+        spill_path = source if isinstance(source, str) else None
+        future.add_done_callback(functools.partial(finish_resume_task, task_id, user[0], digest, spill_path))
         
-        return render_template_string(dashboard_page, 
-                                   role="Job Seeker Dashboard", 
-                                   skills=skills)
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify({'task_id': task_id,
+                            'status_url': url_for('resume_status', task_id=task_id)}), 202
+        return redirect(url_for('dashboard', task=task_id))
 
-    return render_template_string(dashboard_page, 
+    return render_template('dashboard.html', 
                                role="Job Seeker Dashboard", 
                                error="Invalid file type")
 
-# Function to extract skills from resume
-def extract_skills(filepath):
-    common_skills = {
-        'python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular',
-        'node.js', 'docker', 'kubernetes', 'aws', 'azure', 'machine learning',
-        'data analysis', 'project management', 'agile', 'scrum', 'leadership',
-        'communication', 'problem solving', 'teamwork', 'git', 'devops'
-    }
+@app.errorhandler(413)
+def request_too_large(error):
+    if request.endpoint == 'upload_resume':
+        return render_template('dashboard.html', 
+                               role="Job Seeker Dashboard", 
+                               error="File is too large (10 MB maximum)"), 413
+    return error
+
+# Poll a background resume analysis
+@app.route('/resume_status/<task_id>')
+def resume_status(task_id):
+    user = current_user()
+    if user is None:
+        return jsonify({'error': 'Not logged in'}), 401
     
-    extracted_skills = set()
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT status, skills, created_at FROM resume_tasks WHERE id = ? AND username = ?',
+                   (task_id, user[1]))
+    task = cursor.fetchone()
+    if task is None:
+        return jsonify({'error': 'Unknown task'}), 404
+    
+    # A task still pending this long lost its worker, so it will never finish
+    if task[0] == 'pending' and task[2] < time.time() - RESUME_TASK_TIMEOUT:
+        conn.execute("UPDATE resume_tasks SET status = 'failed' WHERE id = ? AND status = 'pending'", (task_id,))
+        conn.commit()
+        task = ('failed',) + task[1:]
     
+    result = {'status': task[0]}
+    if task[0] == 'done':
+        result['skills'] = json.loads(task[1])
+    return jsonify(result)
+
+# Resume parsing runs in a small process pool so a slow PDF never ties up a web
+# worker. Tasks are tracked in SQLite, so any worker can answer a status poll.
+RESUME_WORKERS = 2
+MAX_PENDING_RESUMES = 16
+RESUME_TASK_TTL = 24 * 60 * 60
+RESUME_TASK_TIMEOUT = 5 * 60
+
+resume_pool = None
+resume_pool_pid = None
+resume_pool_lock = threading.Lock()
+resume_slots = threading.BoundedSemaphore(MAX_PENDING_RESUMES)
+
+# Each web worker process gets its own pool, created on first use
+def get_resume_pool(restart=False):
+    global resume_pool, resume_pool_pid
+    with resume_pool_lock:
+        if restart or resume_pool_pid != os.getpid():
+            resume_pool = ProcessPoolExecutor(max_workers=RESUME_WORKERS)
+            resume_pool_pid = os.getpid()
+        return resume_pool
+
+# Runs in a pool process. source is the file's bytes or the path of its spill
+# file. Returns the skills and the task's stage timings.
+def parse_resume(source, filename):
+    timing_local.stages = {}
     try:
-        if filepath.endswith('.pdf'):
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ''
-                for page in pdf_reader.pages:
-                    text += page.extract_text().lower()
-                
-                # Extract skills
-                for skill in common_skills:
-                    if skill in text:
-                        extracted_skills.add(skill.title())
-                        
-    except Exception as e:
-        print(f"Error processing file: {e}")
+        return extract_skills(source, filename), timing_local.stages
+    finally:
+        timing_local.stages = None
+        if isinstance(source, str):
+            os.remove(source)
+        # Pool processes exit without running cleanup, so report every task
+        metrics.flush()
+
+# Runs in the web worker when the pool finishes a resume; the skills become
+# the user's profile in the same transaction that completes the task. A resume
+# with no recognizable skills leaves the profile alone and is not cached.
+def finish_resume_task(task_id, user_id, digest, spill_path, future):
+    resume_slots.release()
+    if future.exception() is None:
+        skills, stages = future.result()
+        status, skills_json = 'done', json.dumps(skills)
+        if SERVER_TIMING:
+            print(json.dumps({'task': task_id, 'status': status, 'stages': timing_summary(stages)}), flush=True)
+    else:
+        print(f"Error processing resume task {task_id}: {future.exception()}")
+        status, skills_json = 'failed', None
+        # A pool process that was killed mid-parse never ran its cleanup
+        if spill_path is not None:
+            try:
+                os.remove(spill_path)
+            except FileNotFoundError:
+                pass
+    with app.app_context():
+        conn = get_db()
+        conn.execute('UPDATE resume_tasks SET status = ?, skills = ? WHERE id = ?', (status, skills_json, task_id))
+        if status == 'done' and skills:
+            save_user_skills(conn, user_id, skills)
+            cache_resume_skills(conn, digest, skills_json)
+        conn.commit()
+
+# Cache of hash -> extracted skills, so an identical re-upload never reaches
+# PyPDF2. Entries are tied to the taxonomy and parser version, and the least
+# recently used ones are evicted beyond RESUME_CACHE_SIZE. Only parses that
+# found skills are cached; version 3 drops the empty results older versions
+# stored for unreadable files.
+RESUME_CACHE_SIZE = 10000
+RESUME_PARSER_VERSION = 3
+RESUME_CACHE_VERSION = hashlib.sha256(
+    '\n'.join([str(RESUME_PARSER_VERSION)] + skill_matcher.terms).encode()).hexdigest()[:16]
+
+def cached_resume_skills(digest):
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT skills FROM resume_cache WHERE hash = ? AND version = ?',
+                   (digest, RESUME_CACHE_VERSION))
+    row = cursor.fetchone()
+    metrics.cache_lookup('resume', row is not None)
+    if row is None:
+        return None
+    conn.execute('UPDATE resume_cache SET last_used = ? WHERE hash = ?', (time.time(), digest))
+    conn.commit()
+    return json.loads(row[0])
+
+def cache_resume_skills(conn, digest, skills):
+    conn.execute('INSERT OR REPLACE INTO resume_cache (hash, version, skills, last_used) VALUES (?, ?, ?, ?)',
+                 (digest, RESUME_CACHE_VERSION, skills, time.time()))
+    conn.execute('''
+        DELETE FROM resume_cache WHERE hash IN (
+            SELECT hash FROM resume_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+        )
+    ''', (RESUME_CACHE_SIZE,))
+
+# Upper bounds on how much of a resume is read, so a huge upload cannot pin a worker
+MAX_RESUME_PAGES = 50
+MAX_RESUME_CHARS = 1_000_000
+
+# Yield the text of a PDF one page at a time, stopping at the page and size caps
+def iter_pdf_text(file):
+    pdf_reader = PyPDF2.PdfReader(file)
+    remaining = MAX_RESUME_CHARS
+    for page in itertools.islice(pdf_reader.pages, MAX_RESUME_PAGES):
+        text = (page.extract_text() or '')[:remaining]
+        metrics.inc('careersync_pdf_pages_parsed_total')
+        yield text
+        remaining -= len(text)
+        if remaining <= 0:
+            break
+
+# A DOCX file is a zip archive with the body text in word/document.xml. The XML
+# is parsed incrementally: each paragraph is yielded and then dropped from the
+# tree, and the decompressed XML read is capped, so memory stays bounded no
+# matter how large (or how compressible) the document is.
+MAX_DOCX_XML_BYTES = 20 * 1024 * 1024
+DOCX_CHUNK_SIZE = 64 * 1024
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+def iter_docx_text(file):
+    remaining = MAX_RESUME_CHARS
+    with zipfile.ZipFile(file) as archive, archive.open('word/document.xml') as document:
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        parts = []
+        depth = 0
+        for _ in range(MAX_DOCX_XML_BYTES // DOCX_CHUNK_SIZE):
+            chunk = document.read(DOCX_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    if depth == 2:
+                        body = element
+                    continue
+                depth -= 1
+                if element.tag == WORD_NAMESPACE + 't':
+                    parts.append(element.text or '')
+                elif element.tag in (WORD_NAMESPACE + 'tab', WORD_NAMESPACE + 'br'):
+                    parts.append(' ')
+                elif element.tag == WORD_NAMESPACE + 'p':
+                    text = ''.join(parts)[:remaining]
+                    parts = []
+                    yield text
+                    remaining -= len(text)
+                    if remaining <= 0:
+                        return
+                # A top-level block (paragraph or table) has been read in full
+                if depth == 2:
+                    body.clear()
+
+# Readers that yield a resume's text a page or paragraph at a time, by extension
+RESUME_READERS = {
+    'pdf': iter_pdf_text,
+    'docx': iter_docx_text,
+}
+
+# Function to extract skills from a resume given as bytes or a file path
+def extract_skills(source, filename):
+    extracted_skills = set()
+    
+    # Errors from an unreadable file propagate, so the task is marked failed
+    reader = RESUME_READERS[filename.rsplit('.', 1)[-1].lower()]
+    with (io.BytesIO(source) if isinstance(source, bytes) else open(source, 'rb')) as file:
+        # Feed the matcher piece by piece and stop as soon as every
+        # skill in the taxonomy has been seen
+        texts = reader(file)
+        while len(extracted_skills) < len(skill_matcher.terms):
+            with timed('parse'):
+                text = next(texts, None)
+            if text is None:
+                break
+            with timed('match'):
+                skill_matcher.find(text, extracted_skills)
         
-    return list(extracted_skills)
+    metrics.inc('careersync_skills_matched_total', len(extracted_skills), source='resume')
+    return [skill.title() for skill in extracted_skills]
+
+# Store the skills found in a job posting so matching never re-scans its text
+def save_job_skills(cursor, job_id, description, qualifications):
+    with timed('match'):
+        skills = skill_matcher.find(description + '\n' + qualifications)
+    metrics.inc('careersync_skills_matched_total', len(skills), source='job')
+    cursor.execute('DELETE FROM job_skills WHERE job_id = ?', (job_id,))
+    cursor.executemany('INSERT INTO job_skills (job_id, skill) VALUES (?, ?)',
+                       [(job_id, skill) for skill in skills])
+
+# Recompute job_skills for every posting, e.g. for rows saved before the table
+# existed or after the taxonomy changes: flask --app app backfill-job-skills
+@app.cli.command('backfill-job-skills')
+def backfill_job_skills():
+    conn = get_db()
+    cursor = conn.cursor()
+    jobs = conn.execute('SELECT id, description, qualifications FROM jobs').fetchall()
+    for job in jobs:
+        save_job_skills(cursor, job[0], job[1], job[2])
+    # Running workers rebuild their job matrix from the new rows
+    conn.execute("UPDATE cache_versions SET version = version + 1 WHERE name = 'job_skills'")
+    conn.commit()
+    click.echo(f"Extracted skills for {len(jobs)} jobs")
 
 @app.route('/post_job', methods=['GET', 'POST'])
 def post_job():
-    if 'username' not in session or session['role'] != 'recruiter':
+    user = current_user()
+    if user is None or user[2] != 'recruiter':
         return redirect(url_for('login'))
     
     if request.method == 'POST':
@@ -2270,75 +1373,102 @@ def post_job():
         location = request.form['location']
         job_type = request.form['job_type']
         
-        conn = sqlite3.connect('database.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO jobs (company_name, role_name, description, qualifications, experience, location, job_type)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (company_name, role_name, description, qualifications, experience, location, job_type))
+        save_job_skills(cursor, cursor.lastrowid, description, qualifications)
         conn.commit()
-        conn.close()
         
         return redirect(url_for('dashboard'))
     
-    return render_template_string(post_job_page)
+    return render_template('post_job.html')
 
 @app.route('/view_jobs')
 def view_jobs():
-    conn = sqlite3.connect('database.db')
+    after, limit = page_params(request.args)
+    
+    conn = get_db()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM jobs')
-    jobs = cursor.fetchall()
-    conn.close()
+    jobs, next_after = fetch_job_page(cursor, {}, after, limit, snippet=True)
     
-    return render_template_string(view_jobs_page, jobs=jobs)
+    return render_template('view_jobs.html', jobs=jobs, next_after=next_after, limit=limit,
+                                  snippet_length=SNIPPET_LENGTH)
 
 @app.route('/filter_jobs', methods=['POST'])
 def filter_jobs():
     data = request.json
-    location = data.get('location')
-    job_type = data.get('job_type')
-    experience = data.get('experience')
+    after, limit = page_params(data)
     
-    query = 'SELECT * FROM jobs WHERE 1=1'
-    params = []
+    conn = get_db()
+    cursor = conn.cursor()
+    results, next_after = fetch_job_page(cursor, data, after, limit, snippet=bool(data.get('snippet')))
+    
+    # Score every job on the page in the same request. The page stays in id
+    # order: the dashboard's score-ordered listing is /rank_jobs, which
+    # replaces this for it, and with_scores only annotates a keyset page
+    if data.get('with_scores') and results:
+        job_ids = [job['id'] for job in results]
+        placeholders = ', '.join('?' * len(job_ids))
+        cursor.execute(f'SELECT job_id, skill FROM job_skills WHERE job_id IN ({placeholders})', job_ids)
+        skills_by_job = {}
+        for job_id, skill in cursor.fetchall():
+            skills_by_job.setdefault(job_id, set()).add(skill)
+        
+        user_skills = get_user_skills()
+        with timed('match'):
+            for job in results:
+                job['percentage'], job['matching_skills'] = score_skills(
+                    user_skills, skills_by_job.get(job['id'], set()))
     
-    if location:
-        query += ' AND location = ?'
-        params.append(location)
-    if job_type:
-        query += ' AND job_type = ?'
-        params.append(job_type)
-    if experience:
-        query += ' AND experience = ?'
-        params.append(experience)
+    return jsonify({'jobs': results, 'next_after': next_after})
+
+# Turn free text into an FTS5 query that matches every word, quoting each one
+# so user input can never be parsed as FTS5 syntax
+def fts_query(text):
+    return ' '.join(f'"{word}"' for word in re.findall(r'\w+', text.lower()))
+
+# Keyword search ranked by BM25 (title and company weigh more than the body),
+# combinable with the same filters as filter_jobs
+@app.route('/search_jobs')
+def search_jobs():
+    query = fts_query(request.args.get('q', ''))
+    limit = page_params(request.args)[1]
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    if not query:
+        return jsonify({'jobs': [], 'next_offset': None})
     
-    conn = sqlite3.connect('database.db')
+    conditions, params = job_filter_conditions(request.args)
+    columns = ', '.join(f'jobs.{field}' for field in JOB_CARD_FIELDS)
+    conn = get_db()
     cursor = conn.cursor()
-    cursor.execute(query, params)
-    jobs = cursor.fetchall()
-    conn.close()
+    cursor.execute(f'''
+        SELECT {columns}, snippet(jobs_fts, 2, '', '', '…', 16) AS snippet
+        FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+        WHERE jobs_fts MATCH ?{conditions}
+        ORDER BY bm25(jobs_fts, 10.0, 5.0, 1.0, 2.0)
+        LIMIT ? OFFSET ?
+    ''', [query] + params + [limit + 1, offset])
+    jobs = [job_card(row) for row in cursor.fetchall()]
     
-    return jsonify([{
-        'id': job[0],
-        'company_name': job[1],
-        'role_name': job[2],
-        'description': job[3],
-        'qualifications': job[4],
-        'experience': job[5],
-        'location': job[6],
-        'job_type': job[7]
-    } for job in jobs])
+    return jsonify({
+        'jobs': jobs[:limit],
+        'next_offset': offset + limit if len(jobs) > limit else None
+    })
 
 @app.route('/job_details/<int:job_id>')
 def job_details(job_id):
-    conn = sqlite3.connect('database.db')
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
     job = cursor.fetchone()
-    conn.close()
+    if job is None:
+        abort(404)
     
-    return jsonify({
+    # Postings never change once saved, so the body can be revalidated by ETag
+    response = jsonify({
         'id': job[0],
         'company_name': job[1],
         'role_name': job[2],
@@ -2348,40 +1478,304 @@ def job_details(job_id):
         'location': job[6],
         'job_type': job[7]
     })
+    response.add_etag()
+    return response.make_conditional(request)
+
+# Replace a user's stored skills with those from their latest resume. Skills
+# arrive title-cased for display and are stored by taxonomy id.
+def save_user_skills(conn, user_id, skills):
+    conn.execute('DELETE FROM user_skills WHERE user_id = ?', (user_id,))
+    conn.executemany('INSERT OR IGNORE INTO user_skills (user_id, skill_id) VALUES (?, ?)',
+                     [(user_id, skill_ids[skill.lower()]) for skill in skills if skill.lower() in skill_ids])
+    conn.execute("UPDATE cache_versions SET version = version + 1 WHERE name = 'user_skills'")
+
+# Skills of the logged-in user, lowercased like job_skills
+def get_user_skills():
+    user = current_user()
+    if user is None:
+        return set()
+    cursor = get_db().cursor()
+    cursor.execute('''
+        SELECT skills.name FROM user_skills JOIN skills ON skills.id = user_skills.skill_id
+        WHERE user_skills.user_id = ?
+    ''', (user[0],))
+    return {row[0] for row in cursor.fetchall()}
+
+# Percentage of the job's skills the user has, plus the skills they share
+def score_skills(user_skills, job_skills):
+    if not job_skills:
+        return 0, []
+    matching_skills = user_skills.intersection(job_skills)
+    return round((len(matching_skills) / len(job_skills)) * 100), sorted(matching_skills)
 
 @app.route('/match_skills/<int:job_id>')
 def match_skills(job_id):
-    # Get job details
-    conn = sqlite3.connect('database.db')
+    # Get the skills extracted when the job was posted
+    conn = get_db()
     cursor = conn.cursor()
-    cursor.execute('SELECT description, qualifications FROM jobs WHERE id = ?', (job_id,))
-    job = cursor.fetchone()
-    conn.close()
+    cursor.execute('SELECT skill FROM job_skills WHERE job_id = ?', (job_id,))
+    job_skills = {row[0] for row in cursor.fetchall()}
     
-    # Get user skills from session
-    user_skills = set(session.get('skills', []))
+    user_skills = get_user_skills()
+    with timed('match'):
+        match_percentage, matching_skills = score_skills(user_skills, job_skills)
     
-    # Extract skills from job description and qualifications
-    job_text = (job[0] + ' ' + job[1]).lower()
-    job_skills = set()
-    for skill in common_skills:
-        if skill in job_text:
-            job_skills.add(skill)
+    return jsonify({
+        'percentage': match_percentage,
+        'matching_skills': matching_skills
+    })
+
+# Top-K jobs for the session's skills. Candidates come from the skill -> job
+# index, so only postings sharing at least one skill with the user are read.
+@app.route('/recommendations')
+def recommendations():
+    k = min(max(request.args.get('k', 10, type=int), 1), 50)
+    user_skills = sorted(get_user_skills())
+    if not user_skills:
+        return jsonify([])
     
-    # Calculate match percentage
-    if not job_skills:
-        match_percentage = 0
-    else:
-        matching_skills = user_skills.intersection(job_skills)
-        match_percentage = round((len(matching_skills) / len(job_skills)) * 100)
+    placeholders = ', '.join('?' * len(user_skills))
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT matched.job_id, matched.hits,
+               (SELECT COUNT(*) FROM job_skills WHERE job_id = matched.job_id) AS total
+        FROM (SELECT job_id, COUNT(*) AS hits FROM job_skills
+              WHERE skill IN ({placeholders}) GROUP BY job_id) AS matched
+        ORDER BY CAST(matched.hits AS REAL) / total DESC, matched.hits DESC, matched.job_id
+        LIMIT ?
+    ''', user_skills + [k])
+    top = cursor.fetchall()
+    if not top:
+        return jsonify([])
+    
+    job_ids = [row[0] for row in top]
+    id_placeholders = ', '.join('?' * len(job_ids))
+    cursor.execute(f'SELECT {job_card_columns()} FROM jobs WHERE id IN ({id_placeholders})', job_ids)
+    jobs = {row[0]: job_card(row) for row in cursor.fetchall()}
+    cursor.execute(f'''
+        SELECT job_id, skill FROM job_skills
+        WHERE job_id IN ({id_placeholders}) AND skill IN ({placeholders})
+    ''', job_ids + user_skills)
+    matching = {}
+    for job_id, skill in cursor.fetchall():
+        matching.setdefault(job_id, []).append(skill)
+    
+    results = []
+    for job_id, hits, total in top:
+        job = jobs[job_id]
+        job['percentage'] = round(hits / total * 100)
+        job['matching_skills'] = sorted(matching.get(job_id, []))
+        results.append(job)
+    
+    return jsonify(results)
+
+# Job skill matrix, keyed on (highest job id, job_skills version). Jobs are
+# only ever appended, so new postings are added as rows; a backfill bumps the
+# version and the matrix is rebuilt. The lock keeps threads from building it
+# at the same time. The key and matrix are swapped in together as one tuple.
+job_matrix = None
+job_matrix_lock = threading.Lock()
+
+# Returns (key, matrix)
+def get_job_matrix(cursor):
+    global job_matrix
+    cursor.execute("SELECT (SELECT MAX(id) FROM jobs), "
+                   "(SELECT version FROM cache_versions WHERE name = 'job_skills')")
+    max_id, version = cursor.fetchone()
+    max_id = max_id or 0
+    current = job_matrix
+    hit = current is not None and current[0] == (max_id, version)
+    metrics.cache_lookup('job_matrix', hit)
+    if hit:
+        return current
+    
+    with job_matrix_lock:
+        current = job_matrix
+        # Another thread may have caught up while this one waited
+        if current is not None and current[0][1] == version and current[0][0] >= max_id:
+            return current
+        if current is not None and current[0][1] == version:
+            # A job's skills are committed with it, so every row up to max_id is there
+            cursor.execute('SELECT job_id, skill FROM job_skills WHERE job_id > ? AND job_id <= ? ORDER BY job_id',
+                           (current[0][0], max_id))
+            matrix = current[1].extend(cursor.fetchall())
+        else:
+            cursor.execute('SELECT job_id, skill FROM job_skills WHERE job_id <= ? ORDER BY job_id', (max_id,))
+            matrix = SkillMatrix(cursor.fetchall())
+        current = job_matrix = ((max_id, version), matrix)
+    return current
+
+# Ids of every job matching the filters, best match for the skills first and
+# ties in id order, with their percentages. Jobs with no taxonomy skills have
+# no matrix row and score 0, so they still appear, after the matches.
+# Rankings are kept in an LRU cache keyed on the matrix key, skills and
+# filters, so every page after the first is a slice; a new posting changes
+# the matrix key and so retires them.
+JOB_RANKING_CACHE_SIZE = 16
+job_rankings = OrderedDict()
+job_rankings_lock = threading.Lock()
+
+def rank_job_ids(cursor, skills, filters):
+    key, matrix = get_job_matrix(cursor)
+    conditions, params = job_filter_conditions(filters)
+    cache_key = (key, frozenset(skills), conditions, tuple(params))
+    with job_rankings_lock:
+        ranking = job_rankings.get(cache_key)
+        if ranking is not None:
+            job_rankings.move_to_end(cache_key)
+    metrics.cache_lookup('job_ranking', ranking is not None)
+    if ranking is not None:
+        return ranking
+    
+    # Bounded by the matrix key, so jobs posted since are not scored as 0
+    cursor.execute('SELECT id FROM jobs WHERE id <= ?' + conditions + ' ORDER BY id', [key[0]] + params)
+    job_ids = np.array([row[0] for row in cursor.fetchall()], dtype=np.int64)
+    with timed('match'):
+        scores = matrix.score(skills)
+        rows = np.searchsorted(matrix.ids, job_ids)
+        known = rows < len(matrix.ids)
+        known[known] = matrix.ids[rows[known]] == job_ids[known]
+        percentages = np.zeros(len(job_ids), dtype=np.int64)
+        percentages[known] = scores[rows[known]]
+        # job_ids is in id order, so a stable sort keeps ties that way
+        order = np.argsort(-percentages, kind='stable')
+    ranking = (job_ids[order], percentages[order].astype(np.uint8))
+    with job_rankings_lock:
+        job_rankings[cache_key] = ranking
+        if len(job_rankings) > JOB_RANKING_CACHE_SIZE:
+            job_rankings.popitem(last=False)
+    return ranking
+
+# Every job ranked against the user's skills in one vectorized pass, optionally
+# narrowed by the same filters as filter_jobs. The dashboard pages through this
+# ranking by offset, so its listing is in match order across pages.
+@app.route('/rank_jobs')
+def rank_jobs():
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    
+    conn = get_db()
+    cursor = conn.cursor()
+    ranked_ids, ranked_percentages = rank_job_ids(cursor, get_user_skills(), request.args)
+    job_ids = [int(job_id) for job_id in ranked_ids[offset:offset + limit]]
+    percentages = ranked_percentages[offset:offset + limit]
+    jobs = {}
+    if job_ids:
+        placeholders = ', '.join('?' * len(job_ids))
+        cursor.execute(f'SELECT {job_card_columns()} FROM jobs WHERE id IN ({placeholders})', job_ids)
+        jobs = {row[0]: job_card(row) for row in cursor.fetchall()}
+    
+    results = []
+    for job_id, percentage in zip(job_ids, percentages):
+        job = jobs[job_id]
+        job['percentage'] = int(percentage)
+        results.append(job)
     
     return jsonify({
-        'percentage': match_percentage,
-        'matching_skills': list(matching_skills) if 'matching_skills' in locals() else []
+        'total': len(ranked_ids),
+        'jobs': results,
+        'next_offset': offset + limit if offset + limit < len(ranked_ids) else None
     })
 
+# Candidate skill matrix over user_skills, rebuilt when any profile changes
+candidate_matrix = None
+candidate_matrix_version = None
+candidate_matrix_lock = threading.Lock()
+
+def get_candidate_matrix(cursor):
+    global candidate_matrix, candidate_matrix_version
+    cursor.execute("SELECT version FROM cache_versions WHERE name = 'user_skills'")
+    version = cursor.fetchone()[0]
+    hit = candidate_matrix_version is not None and candidate_matrix_version >= version
+    metrics.cache_lookup('candidate_matrix', hit)
+    if hit:
+        return candidate_matrix
+    
+    with candidate_matrix_lock:
+        if candidate_matrix_version is None or candidate_matrix_version < version:
+            cursor.execute('''
+                SELECT user_skills.user_id, skills.name
+                FROM user_skills JOIN skills ON skills.id = user_skills.skill_id
+                ORDER BY user_skills.user_id
+            ''')
+            candidate_matrix = SkillMatrix(cursor.fetchall())
+            candidate_matrix_version = version
+    return candidate_matrix
+
+# Job seekers whose resume skills best cover a job, for recruiters. Every
+# candidate is scored against the job's skills in one vectorized pass.
+@app.route('/rank_candidates/<int:job_id>')
+def rank_candidates(job_id):
+    user = current_user()
+    if user is None or user[2] != 'recruiter':
+        return jsonify({'error': 'Recruiters only'}), 403
+    k = min(max(request.args.get('k', 20, type=int), 1), 100)
+
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('SELECT skill FROM job_skills WHERE job_id = ?', (job_id,))
+    job_skills = {row[0] for row in cursor.fetchall()}
+    if not job_skills:
+        return jsonify([])
+
+    matrix = get_candidate_matrix(cursor)
+    with timed('match'):
+        hits = matrix.hits(job_skills)
+        # Stable sort keeps ties in user id order
+        ranked = np.argsort(-hits, kind='stable')
+        top = ranked[hits[ranked] > 0][:k]
+    if not len(top):
+        return jsonify([])
+
+    candidate_ids = [int(candidate_id) for candidate_id in matrix.ids[top]]
+    placeholders = ', '.join('?' * len(candidate_ids))
+    cursor.execute(f'SELECT id, username FROM users WHERE id IN ({placeholders})', candidate_ids)
+    usernames = dict(cursor.fetchall())
+
+    return jsonify([{
+        'id': candidate_id,
+        'username': usernames[candidate_id],
+        'percentage': round(float(hits[row]) / len(job_skills) * 100),
+        'matching_skills': matrix.matching(row, job_skills)
+    } for candidate_id, row in zip(candidate_ids, top)])
+
+# Prometheus scrape endpoint, aggregated across every worker and pool process
+@app.route('/metrics')
+def prometheus_metrics():
+    metrics.flush()
+    return app.response_class(render_metrics(collect_metrics()),
+                              content_type='text/plain; version=0.0.4; charset=utf-8')
+
+# Pages rendered ahead of time by warm_up
+STATIC_PAGES = ('home.html', 'login.html', 'register.html')
+
+# Build everything the first requests would otherwise pay for. gunicorn.conf.py
+# runs this in the master before forking, so workers share the results
+# copy-on-write. The database file is read into the OS page cache (up to the
+# mmap window each connection maps), and the master's connection is closed so
+# no worker inherits it.
+def warm_up():
+    compile_templates()
+    with app.test_request_context():
+        for template in STATIC_PAGES:
+            static_page(template)
+
+    conn = connect_db()
+    try:
+        get_job_matrix(conn.cursor())
+        get_candidate_matrix(conn.cursor())
+    finally:
+        conn.close()
+
+    remaining = MMAP_SIZE
+    with open(DATABASE, 'rb') as f:
+        while remaining > 0 and f.read(1024 * 1024):
+            remaining -= 1024 * 1024
+
 if __name__ == '__main__':
     # Get port from environment variable (Render sets this) or default to 5000
     port = int(os.environ.get('PORT', 5000))
+    clear_metrics()
     # Run on 0.0.0.0 to accept connections from any IP (required for Render)
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
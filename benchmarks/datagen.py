@@ -0,0 +1,203 @@
+# Synthetic data for benchmarking at production scale: jobs with skewed
+# location, job type and experience distributions whose text embeds taxonomy
+# skills, candidate profiles, and a corpus of resume PDFs.
+#
+#     python -m benchmarks.datagen --database bench.db --jobs 1000000 [--candidates 10000]
+#     python -m benchmarks.datagen --resumes 200 --resume-dir resumes/
+#
+# Jobs are generated in vectorized chunks and loaded in a single transaction
+# with the jobs/job_skills indexes and FTS triggers dropped; they are
+# recreated, and the full-text index rebuilt, once at the end.
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.pdf import make_pdf
+
+SEED = 1234
+CHUNK_SIZE = 100_000
+LINES_PER_PAGE = 45
+
+LOCATIONS = ['Mumbai', 'Delhi', 'Bangalore', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad',
+             'Surat', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur', 'Indore', 'Thane', 'Bhopal',
+             'Visakhapatnam', 'Noida', 'Gurugram']
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Freelance', 'Internship', 'Remote']
+EXPERIENCE = ['Fresher', '0-1 year', '1-2 years', '2-3 years', '3-5 years', '5-7 years', '7-10 years',
+              '10+ years']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises',
+             'Wonka', 'Tyrell', 'Cyberdyne']
+ROLES = ['Backend Engineer', 'Frontend Developer', 'Data Analyst', 'DevOps Engineer', 'Project Manager',
+         'Machine Learning Engineer', 'Full Stack Developer', 'QA Engineer', 'Scrum Master', 'Cloud Architect']
+
+# Roughly what a job board sees: most postings are full-time, mid-level, in a
+# handful of metros
+JOB_TYPE_WEIGHTS = [0.62, 0.08, 0.1, 0.04, 0.06, 0.1]
+EXPERIENCE_WEIGHTS = [0.08, 0.1, 0.18, 0.2, 0.22, 0.12, 0.06, 0.04]
+
+# Text around the skills; it must not contain any taxonomy term itself
+FILLER = ('You will work with a friendly team on products used by millions of people, '
+          'own features end to end and help us improve how we build and ship software.')
+RESUME_FILLER = 'Delivered features on time and mentored new colleagues.'
+
+# Resume lengths, mostly short with a long tail past MAX_RESUME_PAGES
+RESUME_PAGES = [1, 2, 3, 5, 10, 25, 60]
+RESUME_PAGE_WEIGHTS = [0.35, 0.3, 0.15, 0.1, 0.05, 0.03, 0.02]
+
+
+# Zipf-like weights, so the first entries of a list dominate
+def zipf(n, exponent=1.0):
+    weights = 1 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+# Description and qualifications mentioning exactly the given skills (two or more)
+def job_text(skills):
+    description = f"We are looking for someone experienced in {', '.join(skills[:-1])} and {skills[-1]}. {FILLER}"
+    qualifications = f"Degree in a related field. Bonus: {skills[0]}."
+    return description, qualifications
+
+
+# One chunk of job rows and their job_skills rows, with ids from first_id
+def generate_jobs(rng, terms, first_id, count):
+    locations = rng.choice(len(LOCATIONS), count, p=zipf(len(LOCATIONS)))
+    job_types = rng.choice(len(JOB_TYPES), count, p=JOB_TYPE_WEIGHTS)
+    experience = rng.choice(len(EXPERIENCE), count, p=EXPERIENCE_WEIGHTS)
+    companies = rng.choice(len(COMPANIES), count, p=zipf(len(COMPANIES), 0.7))
+    roles = rng.choice(len(ROLES), count)
+    skill_counts = rng.integers(2, 9, count)
+    # Weighted sampling without replacement for every row at once: the top-k
+    # of log(weight) plus Gumbel noise is a weighted sample of k skills
+    keys = np.log(zipf(len(terms), 0.8)) + rng.gumbel(size=(count, len(terms)))
+    ranked = np.argsort(-keys, axis=1)
+
+    jobs = []
+    job_skills = []
+    for row in range(count):
+        job_id = first_id + row
+        skills = [terms[index] for index in ranked[row, :skill_counts[row]]]
+        description, qualifications = job_text(skills)
+        jobs.append((job_id, COMPANIES[companies[row]], ROLES[roles[row]], description, qualifications,
+                     EXPERIENCE[experience[row]], LOCATIONS[locations[row]], JOB_TYPES[job_types[row]]))
+        job_skills.extend((job_id, skill) for skill in skills)
+    return jobs, job_skills
+
+
+def load_jobs(conn, terms, count, seed=SEED):
+    rng = np.random.default_rng(seed)
+    first_id = (conn.execute('SELECT MAX(id) FROM jobs').fetchone()[0] or 0) + 1
+    deferred = conn.execute('''
+        SELECT type, name, sql FROM sqlite_master
+        WHERE tbl_name IN ('jobs', 'job_skills') AND type IN ('index', 'trigger') AND sql IS NOT NULL
+    ''').fetchall()
+
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        for kind, name, _ in deferred:
+            conn.execute(f'DROP {kind.upper()} {name}')
+        for start in range(0, count, CHUNK_SIZE):
+            jobs, job_skills = generate_jobs(rng, terms, first_id + start, min(CHUNK_SIZE, count - start))
+            conn.executemany('''
+                INSERT INTO jobs (id, company_name, role_name, description, qualifications, experience, location, job_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', jobs)
+            conn.executemany('INSERT INTO job_skills (job_id, skill) VALUES (?, ?)', job_skills)
+        for _, _, sql in deferred:
+            conn.execute(sql)
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# Job seekers with a few skills each, for rank_candidates
+def load_candidates(conn, skill_ids, count, seed=SEED):
+    rng = random.Random(seed)
+    first_id = (conn.execute('SELECT MAX(id) FROM users').fetchone()[0] or 0) + 1
+    names = sorted(skill_ids)
+    conn.execute('BEGIN IMMEDIATE')
+    conn.executemany('INSERT INTO users (id, username, password, role) VALUES (?, ?, ?, ?)',
+                     [(user_id, f'candidate{user_id}', 'candidate', 'job_seeker')
+                      for user_id in range(first_id, first_id + count)])
+    conn.executemany('INSERT INTO user_skills (user_id, skill_id) VALUES (?, ?)',
+                     [(user_id, skill_ids[skill])
+                      for user_id in range(first_id, first_id + count)
+                      for skill in rng.sample(names, rng.randint(2, 8))])
+    conn.execute("UPDATE cache_versions SET version = version + 1 WHERE name = 'user_skills'")
+    conn.commit()
+
+
+# token makes each resume's bytes unique, so it is parsed rather than served from the cache
+def resume_pdf(rng, terms, pages, token):
+    text = [[f'Worked on {", ".join(rng.sample(terms, 3))} for {rng.randint(1, 9)} years.'
+             if rng.random() < 0.3 else RESUME_FILLER for _ in range(LINES_PER_PAGE)]
+            for _ in range(pages)]
+    text[0].insert(0, f'Resume {token}')
+    return make_pdf(text)
+
+
+def write_resumes(directory, terms, count, seed=SEED):
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    manifest = []
+    for number in range(count):
+        pages = rng.choices(RESUME_PAGES, RESUME_PAGE_WEIGHTS)[0]
+        name = f'resume_{number:05d}.pdf'
+        with open(os.path.join(directory, name), 'wb') as f:
+            f.write(resume_pdf(rng, terms, pages, f'{seed}-{number}'))
+        manifest.append({'file': name, 'pages': pages})
+    with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.datagen')
+    parser.add_argument('--database', help='SQLite file to fill; created and migrated if missing')
+    parser.add_argument('--jobs', type=int, default=1_000_000, help='jobs to add (default 1000000)')
+    parser.add_argument('--candidates', type=int, default=10_000, help='job seekers to add (default 10000)')
+    parser.add_argument('--resumes', type=int, default=0, help='resume PDFs to write (default 0)')
+    parser.add_argument('--resume-dir', default='resumes', help='where to write them (default resumes/)')
+    parser.add_argument('--seed', type=int, default=SEED)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not args.database and not args.resumes:
+        sys.exit('Nothing to do: pass --database and/or --resumes')
+    resume_dir = os.path.abspath(args.resume_dir)
+
+    # app.py migrates DATABASE and creates uploads/ in the working directory
+    # at import time, so import it from a scratch directory
+    if args.database:
+        os.environ['DATABASE'] = os.path.abspath(args.database)
+    os.chdir(tempfile.mkdtemp(prefix='careersync-datagen-'))
+    import app
+    terms = app.skill_matcher.terms
+
+    if args.database:
+        conn = app.connect_db()
+        conn.execute('PRAGMA cache_size = -262144')
+        start = time.perf_counter()
+        load_jobs(conn, terms, args.jobs, args.seed)
+        print(f'Loaded {args.jobs} jobs in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+        start = time.perf_counter()
+        load_candidates(conn, app.skill_ids, args.candidates, args.seed)
+        print(f'Loaded {args.candidates} candidates in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        conn.close()
+
+    if args.resumes:
+        start = time.perf_counter()
+        write_resumes(resume_dir, terms, args.resumes, args.seed)
+        print(f'Wrote {args.resumes} resumes to {resume_dir} in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
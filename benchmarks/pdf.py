@@ -0,0 +1,37 @@
+# Minimal text-only PDF writer, enough for PyPDF2 to extract every line, so
+# benchmarks can build resumes of any size without extra dependencies
+def escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)').encode('latin-1')
+
+
+# pages is a list of pages, each a list of text lines
+def make_pdf(pages):
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    # Content and page objects come next, then the page tree
+    pages_id = len(objects) + 1 + 2 * len(pages)
+    page_ids = []
+    for lines in pages:
+        stream = b'BT /F1 11 Tf 50 780 Td 14 TL ' + b''.join(b'(' + escape(line) + b') Tj T* ' for line in lines) + b'ET'
+        content = add(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        page_ids.append(add(b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R '
+                            b'/Resources << /Font << /F1 %d 0 R >> >> >>' % (pages_id, content, font)))
+    add(b'<< /Type /Pages /Kids [' + b' '.join(b'%d 0 R' % page for page in page_ids) + b'] /Count %d >>' % len(page_ids))
+    catalog = add(b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id)
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, catalog, xref)
+    return bytes(out)
@@ -0,0 +1,271 @@
+# Latency percentiles and throughput for every route, measured through the
+# Flask test client against a seeded SQLite file. Results are written as JSON
+# so runs can be diffed.
+#
+#     python -m benchmarks.routes [--jobs 5000] [--iterations 200] [--concurrency 1] [--output run.json]
+#
+# By default a fresh database is seeded in a temporary directory with a fixed
+# random seed. --database runs against an existing file instead; the run adds
+# benchmark users and resumes to it.
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from benchmarks import datagen
+
+SEED = 1234
+PASSWORD = 'bench'
+SEEKER = 'bench_seeker'
+RECRUITER = 'bench_recruiter'
+SEEKER_SKILLS = ['Python', 'Sql', 'Docker', 'Aws', 'Git']
+CANDIDATES = 500
+POLL_INTERVAL = 0.002
+
+def seed(app_module, jobs):
+    conn = app_module.connect_db()
+    datagen.load_jobs(conn, app_module.skill_matcher.terms, jobs, SEED)
+    datagen.load_candidates(conn, app_module.skill_ids, CANDIDATES, SEED)
+    conn.close()
+
+
+# Benchmark accounts, created if missing; the seeker's profile is reset every run
+def ensure_users(app_module):
+    conn = app_module.connect_db()
+    for username, role in ((SEEKER, 'job_seeker'), (RECRUITER, 'recruiter')):
+        conn.execute('INSERT OR IGNORE INTO users (username, password, role) VALUES (?, ?, ?)',
+                     (username, PASSWORD, role))
+    seeker_id = conn.execute('SELECT id FROM users WHERE username = ?', (SEEKER,)).fetchone()[0]
+    app_module.save_user_skills(conn, seeker_id, SEEKER_SKILLS)
+    conn.commit()
+    conn.close()
+
+
+def upload(client, payload):
+    response = client.post('/upload_resume', data={'resume': (io.BytesIO(payload), 'resume.pdf')},
+                           headers={'Accept': 'application/json'})
+    if response.status_code != 202:
+        return response.status_code == 200 and response.json['status'] == 'done'
+    status_url = response.json['status_url']
+    while True:
+        status = client.get(status_url)
+        if status.status_code != 200:
+            return False
+        if status.json['status'] != 'pending':
+            return status.json['status'] == 'done'
+        time.sleep(POLL_INTERVAL)
+
+
+# Each case is (role, prepare, send). prepare(i) builds the request payload
+# outside the timed section; send(client, payload) returns whether it succeeded.
+def build_cases(app_module, rng):
+    conn = app_module.connect_db()
+    max_id = conn.execute('SELECT MAX(id) FROM jobs').fetchone()[0] or 1
+    # Filter on each column's most common value, so every combination has results
+    common = {column: conn.execute(f'SELECT {column} FROM jobs GROUP BY {column} ORDER BY COUNT(*) DESC LIMIT 1')
+              .fetchone()[0] for column in app_module.JOB_FILTERS}
+    conn.close()
+
+    terms = app_module.skill_matcher.terms
+    job_ids = [rng.randint(1, max_id) for _ in range(1000)]
+    token = uuid.uuid4().hex[:8]
+    stylesheet = app_module.asset_manifest['css/home.css']
+    cached_resume = datagen.resume_pdf(random.Random(SEED), terms, 1, 'cached')
+
+    def ok(response):
+        return response.status_code < 400
+
+    def get(path):
+        return lambda client, payload: ok(client.get(path))
+
+    cases = {
+        'home': ('seeker', None, get('/')),
+        'register': ('seeker', None, get('/register')),
+        'login': ('seeker', None,
+                  lambda client, payload: ok(client.post('/login', data={'username': SEEKER, 'password': PASSWORD}))),
+        'dashboard': ('seeker', None, get('/dashboard')),
+        'asset': ('seeker', None, get(f'/assets/{stylesheet}')),
+        'view_jobs': ('seeker', None, get('/view_jobs')),
+    }
+    for size in range(len(app_module.JOB_FILTERS) + 1):
+        for columns in itertools.combinations(app_module.JOB_FILTERS, size):
+            filters = {column: common[column] for column in columns}
+            cases[f"filter_jobs[{'+'.join(columns) or 'none'}]"] = (
+                'seeker', None,
+                lambda client, payload, filters=filters: ok(
+                    client.post('/filter_jobs', json={**filters, 'with_scores': True, 'snippet': True})))
+    cases.update({
+        'search_jobs': ('seeker', lambda i: terms[i % len(terms)],
+                        lambda client, payload: ok(client.get('/search_jobs', query_string={'q': payload}))),
+        'job_details': ('seeker', lambda i: job_ids[i % len(job_ids)],
+                        lambda client, payload: ok(client.get(f'/job_details/{payload}'))),
+        'match_skills': ('seeker', lambda i: job_ids[i % len(job_ids)],
+                         lambda client, payload: ok(client.get(f'/match_skills/{payload}'))),
+        'recommendations': ('seeker', None, get('/recommendations')),
+        'rank_jobs': ('seeker', None, get('/rank_jobs')),
+        'rank_jobs[location]': ('seeker', None, lambda client, payload: ok(
+            client.get('/rank_jobs', query_string={'location': common['location']}))),
+        'rank_candidates': ('recruiter', lambda i: job_ids[i % len(job_ids)],
+                            lambda client, payload: ok(client.get(f'/rank_candidates/{payload}'))),
+        # Every upload is a new file, so these measure a full parse rather than the cache
+        'upload_resume[small]': ('seeker', lambda i: datagen.resume_pdf(random.Random(i), terms, 1, f'{token}-{i}'),
+                                 upload),
+        'upload_resume[large]': ('seeker', lambda i: datagen.resume_pdf(random.Random(i), terms, 40, f'{token}-{i}'),
+                                 upload),
+        'upload_resume[cached]': ('seeker', lambda i: cached_resume, upload),
+        # Last, since every new posting changes the jobs the other cases read
+        'post_job': ('recruiter', lambda i: datagen.job_text(random.Random(i).sample(terms, 4)),
+                     lambda client, payload: ok(client.post('/post_job', data={
+                         'company_name': 'Bench', 'role_name': 'Benchmark Engineer',
+                         'description': payload[0], 'qualifications': payload[1],
+                         'experience': datagen.EXPERIENCE[0], 'location': datagen.LOCATIONS[0],
+                         'job_type': datagen.JOB_TYPES[0]}))),
+    })
+    return cases
+
+
+def login(app_module, username):
+    client = app_module.app.test_client()
+    client.post('/login', data={'username': username, 'password': PASSWORD})
+    return client
+
+
+def run_case(app_module, case, iterations, warmup, concurrency):
+    role, prepare, send = case
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    counter = itertools.count()
+
+    def worker():
+        nonlocal errors
+        client = login(app_module, SEEKER if role == 'seeker' else RECRUITER)
+        for i in range(warmup):
+            send(client, prepare(-1 - i) if prepare else None)
+        barrier.wait()
+        while True:
+            i = next(counter)
+            if i >= iterations:
+                return
+            payload = prepare(i) if prepare else None
+            start = time.perf_counter()
+            succeeded = send(client, payload)
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                errors += not succeeded
+
+    # The clock starts once every thread has logged in and warmed up
+    barrier = threading.Barrier(concurrency + 1)
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    milliseconds = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'mean_ms': round(float(milliseconds.mean()), 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'throughput_rps': round(len(latencies) / wall, 1),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.routes')
+    parser.add_argument('--database', help='run against this SQLite file instead of seeding a new one')
+    parser.add_argument('--jobs', type=int, default=5000, help='jobs to seed (default 5000)')
+    parser.add_argument('--iterations', type=int, default=200, help='timed requests per route (default 200)')
+    parser.add_argument('--upload-iterations', type=int, default=20,
+                        help='timed requests per resume upload case (default 20)')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests per thread first (default 5)')
+    parser.add_argument('--concurrency', type=int, default=1, help='client threads (default 1)')
+    parser.add_argument('--routes', help='comma-separated substrings; only matching cases run')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # app.py opens DATABASE and creates uploads/ relative to the working
+    # directory at import time, so point both at a scratch directory first
+    workdir = tempfile.mkdtemp(prefix='careersync-bench-')
+    os.environ['DATABASE'] = os.path.abspath(args.database) if args.database else os.path.join(workdir, 'bench.db')
+    os.environ['METRICS_DIR'] = os.path.join(workdir, 'metrics')
+    os.chdir(workdir)
+    import app as app_module
+
+    rng = random.Random(SEED)
+    if not args.database:
+        seed(app_module, args.jobs)
+    ensure_users(app_module)
+    cases = build_cases(app_module, rng)
+    if args.routes:
+        patterns = args.routes.split(',')
+        cases = {name: case for name, case in cases.items() if any(pattern in name for pattern in patterns)}
+
+    conn = app_module.connect_db()
+    jobs = conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+    conn.close()
+
+    results = {}
+    print(f"{'route':<42}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'errors':>8}", file=sys.stderr)
+    try:
+        for name, case in cases.items():
+            iterations = args.upload_iterations if name.startswith('upload_resume') else args.iterations
+            result = results[name] = run_case(app_module, case, iterations, args.warmup, args.concurrency)
+            print(f"{name:<42}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                  f"{result['throughput_rps']:>10.1f}{result['errors']:>8}", file=sys.stderr)
+    finally:
+        if app_module.resume_pool is not None:
+            app_module.resume_pool.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = json.dumps({
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'database': args.database or 'seeded',
+            'jobs': jobs,
+            'seed': SEED,
+            'iterations': args.iterations,
+            'upload_iterations': args.upload_iterations,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency,
+        },
+        'routes': results,
+    }, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Render latency per route: the old render_template_string path, which parses
+# and compiles the template source on every call, against the precompiled
+# templates in templates/.
+#
+#     python -m benchmarks.templates [iterations]
+import sys
+import time
+
+from flask import render_template, render_template_string
+
+from app import app
+
+# Template and context each route renders
+ROUTES = {
+    'home': ('home.html', {}),
+    'login': ('login.html', {}),
+    'register': ('register.html', {}),
+    'dashboard': ('dashboard.html', {'role': 'Job Seeker Dashboard', 'skills': ['Python', 'Sql', 'Docker']}),
+    'post_job': ('post_job.html', {}),
+    'view_jobs': ('view_jobs.html', {
+        'jobs': [{'id': i, 'company_name': 'Acme', 'role_name': 'Engineer', 'experience': '1-2 years',
+                  'location': 'Pune', 'job_type': 'Full-time', 'snippet': 'Build things ' * 12}
+                 for i in range(20)],
+        'next_after': 20,
+        'limit': 20,
+        'snippet_length': 160,
+    }),
+}
+
+
+def time_per_call(render, iterations):
+    render()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'route':<12}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    with app.test_request_context():
+        for route, (name, context) in ROUTES.items():
+            source = app.jinja_env.loader.get_source(app.jinja_env, name)[0]
+            before = time_per_call(lambda: render_template_string(source, **context), iterations)
+            after = time_per_call(lambda: render_template(name, **context), iterations)
+            print(f'{route:<12}{before:>14.3f}{after:>14.3f}{before / after:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
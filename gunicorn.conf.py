@@ -0,0 +1,29 @@
+# Production gunicorn settings: gunicorn -c gunicorn.conf.py app:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Import app.py once in the master. Migrations run a single time, and the
+# skill matcher, compiled templates and skill matrices are built before fork and
+# shared by every worker instead of being rebuilt on each one's first request.
+preload_app = True
+
+# One process per core, each serving a few threads: requests mostly wait on
+# SQLite or the resume pool, and thread-local connections are reused
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+accesslog = '-'
+
+def when_ready(server):
+    from app import clear_metrics, warm_up
+    clear_metrics()
+    warm_up()
+    server.log.info('Warm-up complete')
+
+# Write out the last second of this worker's metrics before it goes
+def worker_exit(server, worker):
+    from app import metrics
+    metrics.flush()
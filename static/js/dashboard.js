@@ -0,0 +1,173 @@
+// Handle file upload display
+document.getElementById('resume').addEventListener('change', function(e) {
+    var fileName = e.target.files[0] ? e.target.files[0].name : 'No file chosen';
+    document.getElementById('selected-file').textContent = fileName;
+});
+
+// Filters of the current listing and the cursor for its next page
+let currentFilters = {};
+let nextPage = null;
+let loadingJobs = false;
+
+function applyFilters() {
+    currentFilters = {
+        q: document.getElementById('keyword-filter').value.trim(),
+        location: document.getElementById('location-filter').value,
+        job_type: document.getElementById('job-type-filter').value,
+        experience: document.getElementById('experience-filter').value
+    };
+    document.getElementById('jobs-container').innerHTML = '';
+    nextPage = {};
+    loadJobs();
+}
+
+async function loadJobs() {
+    if (loadingJobs || !nextPage) {
+        return;
+    }
+    loadingJobs = true;
+
+    try {
+        // Keyword search is ranked by relevance, the default listing by how
+        // well each job matches the user's skills
+        const endpoint = currentFilters.q ? '/search_jobs' : '/rank_jobs';
+        const params = new URLSearchParams({...currentFilters, offset: nextPage.offset || 0});
+        const response = await fetch(`${endpoint}?${params}`);
+        const page = await response.json();
+        nextPage = page.next_offset ? {offset: page.next_offset} : null;
+        displayJobs(page.jobs);
+    } catch (error) {
+        console.error('Error:', error);
+    } finally {
+        loadingJobs = false;
+    }
+}
+
+// Infinite scroll: fetch the next page when the end of the list comes into view
+const jobsSentinel = document.getElementById('jobs-sentinel');
+if (jobsSentinel) {
+    new IntersectionObserver(entries => {
+        if (entries[0].isIntersecting && nextPage) {
+            loadJobs();
+        }
+    }).observe(jobsSentinel);
+}
+
+function displayJobs(jobs) {
+    const container = document.getElementById('jobs-container');
+
+    jobs.forEach(job => {
+        const jobElement = document.createElement('div');
+        jobElement.className = 'job-item';
+        jobElement.innerHTML = `
+            <h3>${job.role_name}</h3>
+            <h4>${job.company_name}</h4>
+            <p>📍 ${job.location} | 💼 ${job.job_type}</p>
+            <p><strong>Experience:</strong> ${job.experience}</p>
+            ${job.snippet ? `<p>${job.snippet}</p>` : ''}
+            <div class="job-actions">
+                <button class="view-details" onclick="viewJobDetails(${job.id})">View Details</button>
+                ${job.percentage === undefined ? `<button class="match-skills" onclick="matchSkills(${job.id})">Match Skills</button>` : ''}
+            </div>
+            <div id="skills-match-${job.id}" class="skills-match"></div>
+        `;
+        container.appendChild(jobElement);
+        // Scores come back with the job list, so no per-job request is needed
+        if (job.percentage !== undefined) {
+            showMatch(job.id, job);
+        }
+    });
+}
+
+function viewJobDetails(jobId) {
+    fetch(`/job_details/${jobId}`)
+        .then(response => response.json())
+        .then(job => {
+            document.getElementById('modalContent').innerHTML = `
+                <h2>${job.role_name}</h2>
+                <h3>${job.company_name}</h3>
+                <p><strong>Location:</strong> ${job.location}</p>
+                <p><strong>Job Type:</strong> ${job.job_type}</p>
+                <p><strong>Experience Required:</strong> ${job.experience}</p>
+                <p><strong>Description:</strong></p>
+                <p>${job.description}</p>
+                <p><strong>Qualifications:</strong></p>
+                <p>${job.qualifications}</p>
+            `;
+            document.getElementById('jobModal').style.display = 'block';
+        });
+}
+
+function closeModal() {
+    document.getElementById('jobModal').style.display = 'none';
+}
+
+function matchSkills(jobId) {
+    fetch(`/match_skills/${jobId}`)
+        .then(response => response.json())
+        .then(result => showMatch(jobId, result));
+}
+
+function showMatch(jobId, result) {
+    const matchElement = document.getElementById(`skills-match-${jobId}`);
+    matchElement.innerHTML = `
+        <span>${result.percentage}% Match</span>
+        <div class="percentage-bar">
+            <div class="percentage-fill" style="width: 0%"></div>
+        </div>
+    `;
+    // Animate the percentage bar
+    setTimeout(() => {
+        matchElement.querySelector('.percentage-fill').style.width = `${result.percentage}%`;
+    }, 100);
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    if (event.target == document.getElementById('jobModal')) {
+        closeModal();
+    }
+}
+
+// Wait for a background resume analysis, then reload to show the extracted skills.
+// Polling stops after a while in case the task never completes.
+const MAX_RESUME_POLLS = 360;
+
+function showResumeFailure() {
+    document.getElementById('resume-status').textContent = 'Could not analyze this resume, please try again.';
+}
+
+async function pollResumeTask(taskId, attempt = 1) {
+    try {
+        const response = await fetch(`/resume_status/${taskId}`);
+        const result = await response.json();
+        if (result.status === 'done' && result.skills.length === 0) {
+            document.getElementById('resume-status').textContent = 'No skills were found in this resume, so your profile was not changed.';
+            return;
+        }
+        if (result.status === 'done') {
+            window.location = '/dashboard';
+            return;
+        }
+        if (!response.ok || result.status === 'failed') {
+            showResumeFailure();
+            return;
+        }
+    } catch (error) {
+        console.error('Error:', error);
+    }
+    if (attempt >= MAX_RESUME_POLLS) {
+        showResumeFailure();
+        return;
+    }
+    setTimeout(() => pollResumeTask(taskId, attempt + 1), 1000);
+}
+
+if (resumeTask) {
+    pollResumeTask(resumeTask);
+}
+
+// Load jobs initially if skills are present
+if (userSkills.length > 0) {
+    applyFilters();
+}